@@ -2,22 +2,25 @@
 
 """Perpetuation of Lola's daily announcement for the holy object.
 
-A desktop notification is sent unless ``notify-send`` program is not
-found or called with ``--stdout`` argument.
+A desktop notification is sent unless called with ``--stdout``
+argument or no session bus is found, standard output being used
+instead. The notification server is called directly through D-Bus
+when the ``jeepney`` library is installed, libnotify then the
+``notify-send`` program being used as fallbacks.
 
 """
 
-from dataclasses import dataclass
-from enum import Enum
-from pathlib import Path
-import argparse
-import base64
-import datetime
+import array
+import collections
+import functools
 import logging
-import subprocess
+import os
+import string
+import sys
+import time
 
-logging.basicConfig()
-LOGGER = logging.getLogger()
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
 
 
 ANNOUNCE_TEMPLATE = """\
@@ -25,675 +28,1115 @@ Chalut ! Aujourd'hui, {day_name} {day}, c'est la {hallow_prefix}-{hallow}.
 Bonne fête à {hallow_all} les {hallow_plural} 🎆\
 """
 
+
+def _compile_template(template: str):
+    """Return a function rendering the template.
+
+    The template is parsed once, rendering then joins literal texts
+    and field values given as keyword arguments. Conversions and
+    format specifications aren't supported.
+    """
+    pieces = tuple(
+        (literal_text, field_name)
+        for literal_text, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+    def render(**fields) -> str:
+        parts = []
+        for literal_text, field_name in pieces:
+            parts.append(literal_text)
+            if field_name is not None:
+                parts.append(str(fields[field_name]))
+        return "".join(parts)
+
+    return render
+
+
+# The announce is made of a text line followed by a summary line
+_TEXT_TEMPLATE, _SUMMARY_TEMPLATE = ANNOUNCE_TEMPLATE.split("\n")
+_render_text = _compile_template(_TEXT_TEMPLATE)
+_render_summary = _compile_template(_SUMMARY_TEMPLATE)
+
 DAY_NAMES = ("Lourdi", "Pardi", "Morquidi", "Jourdi", "Dendrevi", "Sordi", "Mitanche")
 
 LOLA_PNG_PATH = "/tmp/lola.png"
 
-class Genre(Enum):
-    MALE = (0,)
-    FEMALE = 1
-    NEUTRAL = 2
+# Genres, as stored in the packed table
+MALE = 0
+FEMALE = 1
+NEUTRAL = 2
 
+# Indexed by genre, neutral agreeing as masculine
+HALLOW_PREFIXES = ("Saint", "Sainte", "Saint")
+HALLOW_ALLS = ("tous", "toutes", "tous")
 
-@dataclass
-class DayData:
-    singular: str
-    plural: str
-    genre: Genre
 
+DayData = collections.namedtuple("DayData", ("singular", "plural", "genre"))
 
-# See https://github.com/tobozo/SaintObjetBot for data credits
-DATA_MAP: dict[tuple[int, int], DayData] = {
-    (1, 1): DayData("veisalgie", "veisalgies", Genre.FEMALE),
-    (1, 2): DayData("ankylostome", "ankylostomes", Genre.MALE),
-    (1, 3): DayData("apex", "apexes", Genre.MALE),
-    (1, 4): DayData("arlequin", "arlequins", Genre.MALE),
-    (1, 5): DayData("bengali", "bengalis", Genre.MALE),
-    (1, 6): DayData("bouquetin", "bouquetins", Genre.MALE),
-    (1, 7): DayData("cancrelat", "cancrelats", Genre.MALE),
-    (1, 8): DayData("cerf-volant", "cerfs-volants", Genre.MALE),
-    (1, 9): DayData("colibri", "colibris", Genre.MALE),
-    (1, 10): DayData("dromadaire", "dromadaires", Genre.MALE),
-    (1, 11): DayData("embrouillamini", "embrouillaminis", Genre.MALE),
-    (1, 12): DayData("fauconneau", "fauconeaux", Genre.MALE),
-    (1, 13): DayData("gambette", "gambettes", Genre.FEMALE),
-    (1, 14): DayData("hérisson", " hérissons", Genre.MALE),
-    (1, 15): DayData("javelot", "javelots", Genre.MALE),
-    (1, 16): DayData("kangourou", "kangourous", Genre.MALE),
-    (1, 17): DayData("lampion", "lampions", Genre.MALE),
-    (1, 18): DayData("manuscrit", "manuscrits", Genre.MALE),
-    (1, 19): DayData("quignon", "quignons", Genre.MALE),
-    (1, 20): DayData("tablier", "tabliers", Genre.MALE),
-    (1, 21): DayData("zorglub", "zorglubs", Genre.MALE),
-    (1, 22): DayData("pataquès", "pataquès", Genre.MALE),
-    (1, 23): DayData("bobèche", "bobèches", Genre.FEMALE),
-    (1, 24): DayData("zézaiement", "zézaiements", Genre.MALE),
-    (1, 25): DayData("flibustier", "flibustiers", Genre.MALE),
-    (1, 26): DayData("mirliton", "mirlitons", Genre.MALE),
-    (1, 27): DayData("craspouille", "craspouilles", Genre.FEMALE),
-    (1, 28): DayData("zigouigoui", "zigouigouis", Genre.MALE),
-    (1, 29): DayData("faribole", "fariboles", Genre.FEMALE),
-    (1, 30): DayData("pantouflette", "pantouflettes", Genre.FEMALE),
-    (1, 31): DayData("zinzin", "zinzins", Genre.MALE),
-    (2, 1): DayData("bibelot", "bibelots", Genre.MALE),
-    (2, 2): DayData("ukulélé", "ukulélés", Genre.MALE),
-    (2, 3): DayData("grigris", "grigris", Genre.MALE),
-    (2, 4): DayData("crinoline", "crinolines", Genre.FEMALE),
-    (2, 5): DayData("turlutaine", "turlutaines", Genre.FEMALE),
-    (2, 6): DayData("boudeuse", "boudeuses", Genre.FEMALE),
-    (2, 7): DayData("tralala", "tralalas", Genre.MALE),
-    (2, 8): DayData("carambolage", "carambolages", Genre.MALE),
-    (2, 9): DayData("frimousse", "frimousses", Genre.FEMALE),
-    (2, 10): DayData("catafalque", "catafalques", Genre.MALE),
-    (2, 11): DayData("chicane", "chicanes", Genre.FEMALE),
-    (2, 12): DayData("barbichette", "barbichettes", Genre.FEMALE),
-    (2, 13): DayData("croquignole", "croquignoles", Genre.MALE),
-    (2, 14): DayData("rouleau de sopalin", "rouleaux de sopalin", Genre.MALE),
-    (2, 15): DayData("clavicule", "clavicules", Genre.FEMALE),
-    (2, 16): DayData("bambinette", "bambinettes", Genre.FEMALE),
-    (2, 17): DayData("sporange", "sporanges", Genre.MALE),
-    (2, 18): DayData("fléole", "fléoles", Genre.FEMALE),
-    (2, 19): DayData("goubelin", "goubelins", Genre.MALE),
-    (2, 20): DayData("bélin", "bélins", Genre.MALE),
-    (2, 21): DayData("grébiche", "grébiches", Genre.FEMALE),
-    (2, 22): DayData("pipistrelle", "pipistrelles", Genre.FEMALE),
-    (2, 23): DayData("badine", "badines", Genre.FEMALE),
-    (2, 24): DayData("guttule", "guttules", Genre.FEMALE),
-    (2, 25): DayData("sautoir", "sautoirs", Genre.MALE),
-    (2, 26): DayData("tourniquet", "tourniquets", Genre.MALE),
-    (2, 27): DayData("grenouillère", "grenouillères", Genre.FEMALE),
-    (2, 28): DayData("torsade", "torsades", Genre.FEMALE),
-    (2, 29): DayData("calicot", "calicots", Genre.MALE),
-    (3, 1): DayData("gousset", "goussets", Genre.MALE),
-    (3, 2): DayData("tournebille", "tournebilles", Genre.FEMALE),
-    (3, 3): DayData("gibelotte", "gibelottes", Genre.FEMALE),
-    (3, 4): DayData("cabestan", "cabestans", Genre.MALE),
-    (3, 5): DayData("mélopée", "mélodées", Genre.FEMALE),
-    (3, 6): DayData("galurin", "galurins", Genre.MALE),
-    (3, 7): DayData("joug", "jougs", Genre.MALE),
-    (3, 8): DayData("cabriole", "cabrioles", Genre.FEMALE),
-    (3, 9): DayData("attache parisienne", "attaches parisiennes", Genre.FEMALE),
-    (3, 10): DayData("bac à charbon", "bacs à charbon", Genre.MALE),
-    (3, 11): DayData("béquille", "béquilles", Genre.FEMALE),
-    (3, 12): DayData("boussole", "boussoles", Genre.FEMALE),
-    (3, 13): DayData("caméra argentique", "caméras argentiques", Genre.FEMALE),
-    (3, 14): DayData("canne", "cannes", Genre.FEMALE),
-    (3, 15): DayData("cloche", "cloches", Genre.FEMALE),
-    (3, 16): DayData("clou", "clous", Genre.MALE),
-    (3, 17): DayData("coton-tige", "cotons-tiges", Genre.MALE),
-    (3, 18): DayData("disque vinyle", "disques vinyles", Genre.MALE),
-    (3, 19): DayData("encrier", "encriers", Genre.MALE),
-    (3, 20): DayData("fer à repasser", "fers à repasser", Genre.MALE),
-    (3, 21): DayData("fusil à pompe", "fusils à pompe", Genre.MALE),
-    (3, 22): DayData("gourde", "gourdes", Genre.FEMALE),
-    (3, 23): DayData(
-        "imprimante à marguerite", "imprimantes à marguerite", Genre.FEMALE
-    ),
-    (3, 24): DayData("tendu-de-majeur", "doigts d'honneur", Genre.MALE),
-    (3, 25): DayData("machine à écrire", "machines à écrire", Genre.FEMALE),
-    (3, 26): DayData("poignée de porte", "poignées de porte", Genre.FEMALE),
-    (3, 27): DayData("savon de marseille", "savons de marseille", Genre.MALE),
-    (3, 28): DayData("stylo à plume", "stylos à plume", Genre.MALE),
-    (3, 29): DayData("téléviseur cathodique", "téléviseurs cathodiques", Genre.MALE),
-    (3, 30): DayData("urne funéraire", "urnes funéraires", Genre.FEMALE),
-    (3, 31): DayData("balai", "balais", Genre.MALE),
-    (4, 1): DayData("microplastique", "microplastiques", Genre.MALE),
-    (4, 2): DayData("bougie", "bougies", Genre.FEMALE),
-    (4, 3): DayData("cabine téléphonique", "cabines téléphoniques", Genre.FEMALE),
-    (4, 4): DayData("canapé", "canapés", Genre.MALE),
-    (4, 5): DayData("carte postale", "cartes postales", Genre.FEMALE),
-    (4, 6): DayData("ceinture", "ceintures", Genre.FEMALE),
-    (4, 7): DayData("engrenage", "engrenages", Genre.MALE),
-    (4, 8): DayData("escalier", "escaliers", Genre.MALE),
-    (4, 9): DayData("monogramme", "monogrammes", Genre.MALE),
-    (4, 10): DayData("acanthe", "acanthes", Genre.FEMALE),
-    (4, 11): DayData("humus", "humus", Genre.MALE),
-    (4, 12): DayData("entroque", "entroque", Genre.FEMALE),
-    (4, 13): DayData("fourneau", "fourneaux", Genre.MALE),
-    (4, 14): DayData(
-        "ampoule multiprise et rallonge",
-        "ampoules multiprises et rallonges",
-        Genre.FEMALE,
-    ),
-    (4, 15): DayData("alésoir à cliquet", "Alésoirs à cliquets", Genre.MALE),
-    (4, 16): DayData("clapier", "clapiers", Genre.MALE),
-    (4, 17): DayData("taloche", "taloches", Genre.FEMALE),
-    (4, 18): DayData("occiput", "occiputs", Genre.MALE),
-    (4, 19): DayData("diodon", "diodons", Genre.MALE),
-    (4, 20): DayData("tricorne", "tricornes", Genre.MALE),
-    (4, 21): DayData("spume", "spumes", Genre.FEMALE),
-    (4, 22): DayData("manchon", "manchons", Genre.MALE),
-    (4, 23): DayData("limaçon", "limaçons", Genre.MALE),
-    (4, 24): DayData("levraut", "levrauts", Genre.MALE),
-    (4, 25): DayData("gymkhana", "gymkhanas", Genre.MALE),
-    (4, 26): DayData("dosimètre", "dosimètres", Genre.MALE),
-    (4, 27): DayData("queue-de-pie", "queues-de-pie", Genre.FEMALE),
-    (4, 28): DayData("clé à pipe débouchée", "Clés à pipe débouchées", Genre.FEMALE),
-    (4, 29): DayData("perruque", "perruques", Genre.FEMALE),
-    (4, 30): DayData("traille", "trailles", Genre.FEMALE),
-    (5, 1): DayData("tripalium", "tripaliums", Genre.MALE),
-    (5, 2): DayData("pastille", "pastilles", Genre.FEMALE),
-    (5, 3): DayData("francisque", "francisques", Genre.FEMALE),
-    (5, 4): DayData("pirouette", "pirouettes", Genre.FEMALE),
-    (5, 5): DayData("marmouset", "marmousets", Genre.MALE),
-    (5, 6): DayData("pédicelle", "pédicelles", Genre.MALE),
-    (5, 7): DayData("hypsomètre", "hypsomètres", Genre.MALE),
-    (5, 8): DayData("lambrequin", "lambrequins", Genre.MALE),
-    (5, 9): DayData("cribellum", "cribellums", Genre.MALE),
-    (5, 10): DayData("hélicoïde", "hélicoïdes", Genre.FEMALE),
-    (5, 11): DayData("quenouille", "quenouilles", Genre.FEMALE),
-    (5, 12): DayData("zythum", "zytha", Genre.MALE),
-    (5, 13): DayData("sarbacane", "sarbacanes", Genre.FEMALE),
-    (5, 14): DayData("turion", "turions", Genre.MALE),
-    (5, 15): DayData("blaireau", "blaireaux", Genre.MALE),
-    (5, 16): DayData("sémaphore", "sémaphores", Genre.FEMALE),
-    (5, 17): DayData("crispatule", "crispatules", Genre.FEMALE),
-    (5, 18): DayData("zist", "zists", Genre.MALE),
-    (5, 19): DayData("chiquenaude", "chiquenaudes", Genre.FEMALE),
-    (5, 20): DayData("sagouin", "sagouins", Genre.MALE),
-    (5, 21): DayData("borborygme", "borborygmes", Genre.MALE),
-    (5, 22): DayData("zéphyr", "zéphyrs", Genre.MALE),
-    (5, 23): DayData("schnock", "schnocks", Genre.MALE),
-    (5, 24): DayData("pendeloque", "pendeloques", Genre.FEMALE),
-    (5, 25): DayData("falbala", "falbalas", Genre.MALE),
-    (5, 26): DayData("nycthémère", "nycthémères", Genre.MALE),
-    (5, 27): DayData("houppier", "houppiers", Genre.MALE),
-    (5, 28): DayData("suaire", "suaires", Genre.MALE),
-    (5, 29): DayData("jable", "jables", Genre.MALE),
-    (5, 30): DayData("goulot", "goulots", Genre.MALE),
-    (5, 31): DayData("bourdalou", "bourdalous", Genre.MALE),
-    (6, 1): DayData("zibeline", "zibelines", Genre.FEMALE),
-    (6, 2): DayData("turpitude", "turpitudes", Genre.FEMALE),
-    (6, 3): DayData("carafon", "carafons", Genre.MALE),
-    (6, 4): DayData("roubignole", "roubignoles", Genre.FEMALE),
-    (6, 5): DayData("cantharide", "cantharides", Genre.FEMALE),
-    (6, 6): DayData("pédoncule", "pédoncules", Genre.MALE),
-    (6, 7): DayData("élytre", "élytres", Genre.MALE),
-    (6, 8): DayData("cressonnière", "cressonnières", Genre.FEMALE),
-    (6, 9): DayData("araignée", "araignées", Genre.FEMALE),
-    (6, 10): DayData("sarment", "sarments", Genre.MALE),
-    (6, 11): DayData("argousin", "argousins", Genre.MALE),
-    (6, 12): DayData("poudingue", "poudingues", Genre.MALE),
-    (6, 13): DayData("pandiculation", "pandiculations", Genre.FEMALE),
-    (6, 14): DayData("gaudriole", "gaudrioles", Genre.FEMALE),
-    (6, 15): DayData("chenapan", "chenapans", Genre.MALE),
-    (6, 16): DayData("carabistouille", "carabistouilles", Genre.FEMALE),
-    (6, 17): DayData("baliverne", "balivernes", Genre.FEMALE),
-    (6, 18): DayData("histrion", "histrions", Genre.MALE),
-    (6, 19): DayData("babiole", "babioles", Genre.FEMALE),
-    (6, 20): DayData("pétouille", "pétouilles", Genre.FEMALE),
-    (6, 21): DayData("baragouin", "baragouins", Genre.MALE),
-    (6, 22): DayData("patatras", "patatras", Genre.MALE),
-    (6, 23): DayData("alambic", "alambics", Genre.MALE),
-    (6, 24): DayData("billevesée", "billevesées", Genre.FEMALE),
-    (6, 25): DayData("rigolboche", "rigolboches", Genre.FEMALE),
-    (6, 26): DayData("turlupin", "turlupins", Genre.MALE),
-    (6, 27): DayData("turlurette", "turlurettes", Genre.FEMALE),
-    (6, 28): DayData("guignol", "guignols", Genre.MALE),
-    (6, 29): DayData("bille-molle", "billes-molles", Genre.FEMALE),
-    (6, 30): DayData("brimborion", "brimborions", Genre.MALE),
-    (7, 1): DayData("mirliflore", "mirliflores", Genre.FEMALE),
-    (7, 2): DayData("clapiotte", "clapiottes", Genre.FEMALE),
-    (7, 3): DayData("gaffophone", "gaffophones", Genre.MALE),
-    (7, 4): DayData("légumineur", "légumineurs", Genre.MALE),
-    (7, 5): DayData("micro-onduleur", "micro-onduleurs", Genre.MALE),
-    (7, 6): DayData("frite-magique", "frites-magiques", Genre.FEMALE),
-    (7, 7): DayData(
-        "extracteur du potentiel de point zéro",
-        "extracteurs du potentiel de point zéro",
-        Genre.MALE,
-    ),
-    (7, 8): DayData("réveil-tartine", "réveils-tartines", Genre.MALE),
-    (7, 9): DayData("horloge-moussante", "horloges-moussantes", Genre.FEMALE),
-    (7, 10): DayData("canapélicoptère", "canapélicoptères", Genre.MALE),
-    (7, 11): DayData("éponge-lumineuse", "éponges-lumineuses", Genre.FEMALE),
-    (7, 12): DayData("spatulon", "spatulons", Genre.MALE),
-    (7, 13): DayData("vaissellier-volant", "vaisselliers-volants", Genre.MALE),
-    (7, 14): DayData("boîte-à-bêtises", "boîtes-à-bêtises", Genre.FEMALE),
-    (7, 15): DayData("télé-poubelle", "télé-poubelles", Genre.FEMALE),
-    (7, 16): DayData("baignoire-parlante", "baignoires-parlantes", Genre.FEMALE),
-    (7, 17): DayData("armoire-à-glissade", "armoires-à-glissade", Genre.FEMALE),
-    (7, 18): DayData("pierre manale", "pierres manales", Genre.FEMALE),
-    (7, 19): DayData(
-        "grille-pain de l'espace", "grilles-pains de l'espace", Genre.MALE
-    ),
-    (7, 20): DayData("robot-raccommodeur", "robots-raccommodeurs", Genre.MALE),
-    (7, 21): DayData("fourchette-à-comptine", "fourchettes-à-comptines", Genre.FEMALE),
-    (7, 22): DayData("pantoufle-réactive", "pantoufles-réactives", Genre.FEMALE),
-    (7, 23): DayData("coussin-péteur", "coussins-péteurs", Genre.MALE),
-    (7, 24): DayData("télé-orbitale", "télés-orbitales", Genre.FEMALE),
-    (7, 25): DayData("brosse-à-dent sonique", "brosses-à-dent soniques", Genre.FEMALE),
-    (7, 26): DayData("couette-intelligente", "couettes-intelligentes", Genre.FEMALE),
-    (7, 27): DayData("pyjama-à-histoires", "pyjamas-à-histoires", Genre.MALE),
-    (7, 28): DayData("bol-à-mystère", "bols-à-mystère", Genre.MALE),
-    (7, 29): DayData("tabouret-téléphone", "tabourets-téléphone", Genre.MALE),
-    (7, 30): DayData("miroir-savant", "miroirs-savants", Genre.MALE),
-    (7, 31): DayData(
-        "tapis-volant d'intérieur", "tapis-volants d'intérieur", Genre.MALE
-    ),
-    (8, 1): DayData("oreiller-à-musique", "oreillers-à-musique", Genre.MALE),
-    (8, 2): DayData(
-        "papier-peint interactif", "papiers-peints interactifs", Genre.MALE
-    ),
-    (8, 3): DayData("xylophone", "xylophones", Genre.MALE),
-    (8, 4): DayData("guilloché", "guillochés", Genre.MALE),
-    (8, 5): DayData("djembé", "djembés", Genre.MALE),
-    (8, 6): DayData("caipirinha", "caipirinhas", Genre.FEMALE),
-    (8, 7): DayData("tzatziki", "tzatzikis", Genre.NEUTRAL),
-    (8, 8): DayData("karaoke", "karaokes", Genre.MALE),
-    (8, 9): DayData("kantele", "kanteles", Genre.FEMALE),
-    (8, 10): DayData("haiku", "haikus", Genre.MALE),
-    (8, 11): DayData("colchique", "colchiques", Genre.FEMALE),
-    (8, 12): DayData("molinillo", "molinillos", Genre.MALE),
-    (8, 13): DayData("quokka", "quokkas", Genre.FEMALE),
-    (8, 14): DayData("duduk", "duduks", Genre.MALE),
-    (8, 15): DayData("balalaïka", "balalaïkas", Genre.FEMALE),
-    (8, 16): DayData("fajitas", "fajitas", Genre.FEMALE),
-    (8, 17): DayData("bobineau", "bobineaux", Genre.MALE),
-    (8, 18): DayData("fjord", "fjords", Genre.MALE),
-    (8, 19): DayData("tsampa", "tsampas", Genre.FEMALE),
-    (8, 20): DayData("qipao", "qipaos", Genre.FEMALE),
-    (8, 21): DayData("boomerang", "boomerangs", Genre.MALE),
-    (8, 22): DayData("cachou", "cachous", Genre.MALE),
-    (8, 23): DayData("sac à dos", "sacs à dos", Genre.MALE),
-    (8, 24): DayData("brosse à dents", "brosses à dents", Genre.FEMALE),
-    (8, 25): DayData("lampe de bureau", "lampes de bureau", Genre.FEMALE),
-    (8, 26): DayData("tapis de souris", "tapis de souris", Genre.MALE),
-    (8, 27): DayData("pot de fleurs", "pots de fleurs", Genre.MALE),
-    (8, 28): DayData("brosse à cheveux", "brosses à cheveux", Genre.FEMALE),
-    (8, 29): DayData("boucle d'oreille", "boucles d'oreilles", Genre.FEMALE),
-    (8, 30): DayData("manette de jeu", "manettes de jeu", Genre.FEMALE),
-    (8, 31): DayData("tapis de yoga", "tapis de yoga", Genre.MALE),
-    (9, 1): DayData("corde à sauter", "cordes à sauter", Genre.FEMALE),
-    (9, 2): DayData("haltère", "haltères", Genre.MALE),
-    (9, 3): DayData("trottinette", "trottinettes", Genre.FEMALE),
-    (9, 4): DayData("sac de couchage", "sacs de couchage", Genre.MALE),
-    (9, 5): DayData("réchaud de camping", "réchauds de camping", Genre.MALE),
-    (9, 6): DayData("chaussure de randonnée", "chaussures de randonnée", Genre.FEMALE),
-    (9, 7): DayData("taille-crayon", "taille-crayons", Genre.MALE),
-    (9, 8): DayData("agrafeuse", "agrafeuses", Genre.FEMALE),
-    (9, 9): DayData("aspirateur", "aspirateurs", Genre.MALE),
-    (9, 10): DayData("lave-linge", "lave-linges", Genre.MALE),
-    (9, 11): DayData("sèche-linge", "sèche-linges", Genre.MALE),
-    (9, 12): DayData("machine à coudre", "machines à coudre", Genre.FEMALE),
-    (9, 13): DayData("serpillère", "serpillères", Genre.FEMALE),
-    (9, 14): DayData("tronçonneuse", "tronçonneuses", Genre.FEMALE),
-    (9, 15): DayData("débroussailleuse", "débroussailleuses", Genre.FEMALE),
-    (9, 16): DayData("motoculteur", "motoculteurs", Genre.MALE),
-    (9, 17): DayData("râteau", "râteaux", Genre.MALE),
-    (9, 18): DayData("clé à molette", "clés à molette", Genre.FEMALE),
-    (9, 19): DayData("scie circulaire", "scies circulaires", Genre.FEMALE),
-    (9, 20): DayData("détecteur de fumée", "détecteurs de fumée", Genre.MALE),
-    (9, 21): DayData("caméra de surveillance", "caméras de surveillance", Genre.FEMALE),
-    (9, 22): DayData("moustiquaire", "moustiquaires", Genre.FEMALE),
-    (9, 23): DayData("brise-vent", "brise-vent", Genre.MALE),
-    (9, 24): DayData("balcon", "balcons", Genre.MALE),
-    (9, 25): DayData("jardinière", "jardinières", Genre.FEMALE),
-    (9, 26): DayData("buisson", "buissons", Genre.MALE),
-    (9, 27): DayData("haie", "haies", Genre.FEMALE),
-    (9, 28): DayData("système d'irrigation", "systèmes d'irrigation", Genre.MALE),
-    (9, 29): DayData("thermomètre", "thermomètres", Genre.MALE),
-    (9, 30): DayData("hygromètre", "hygromètres", Genre.MALE),
-    (10, 1): DayData("luxmètre", "luxmètres", Genre.MALE),
-    (10, 2): DayData("anémomètre", "anémomètres", Genre.MALE),
-    (10, 3): DayData("pluviomètre", "pluviomètres", Genre.MALE),
-    (10, 4): DayData("baromètre", "baromètres", Genre.MALE),
-    (10, 5): DayData("chronomètre", "chronomètres", Genre.MALE),
-    (10, 6): DayData("microscope", "microscopes", Genre.MALE),
-    (10, 7): DayData("télescope", "télescopes", Genre.MALE),
-    (10, 8): DayData("spectroscope", "spectroscopes", Genre.MALE),
-    (10, 9): DayData("sac à bière", "sacs à bière", Genre.MALE),
-    (10, 10): DayData("ohmmètre", "ohmmètres", Genre.MALE),
-    (10, 11): DayData("ampermètre", "ampermètres", Genre.MALE),
-    (10, 12): DayData("voltmètre", "voltmètres", Genre.MALE),
-    (10, 13): DayData("oscilloscope", "oscilloscopes", Genre.MALE),
-    (10, 14): DayData("fréquencemètre", "fréquencemètres", Genre.MALE),
-    (10, 15): DayData("analyseur de spectre", "analyseurs de spectre", Genre.MALE),
-    (10, 16): DayData("circuit imprimé", "circuits imprimés", Genre.MALE),
-    (10, 17): DayData("disjoncteur", "disjoncteurs", Genre.MALE),
-    (10, 18): DayData(
-        "machine-à-faire-des-trous-dans-les-spaghetti",
-        "machines-à-faire-des-trous-dans-les-spaghetti",
-        Genre.FEMALE,
-    ),
-    (10, 19): DayData("morceau de bois", "morceaux de bois", Genre.MALE),
-    (10, 20): DayData("pot de colle", "pots de colle", Genre.MALE),
-    (10, 21): DayData("paquet cadeau", "paquets cadeaux", Genre.MALE),
-    (10, 22): DayData("cacatoès", "cacatoès", Genre.FEMALE),
-    (10, 23): DayData("harmonica", "harmonicas", Genre.MALE),
-    (10, 24): DayData("bigoudi", "bigoudis", Genre.MALE),
-    (10, 25): DayData("dent de lait", "dents de lait", Genre.FEMALE),
-    (10, 26): DayData("bonhomme de neige", "bonhommes de neige", Genre.MALE),
-    (10, 27): DayData("marteau picoreur", "marteaux picoreurs", Genre.MALE),
-    (10, 28): DayData("bande magnétique", "bandes magnétiques", Genre.FEMALE),
-    (10, 29): DayData("punaise de lit", "punaises de lit", Genre.FEMALE),
-    (10, 30): DayData("carte de voeux", "cartes de voeux", Genre.FEMALE),
-    (10, 31): DayData("moins que rien", "moins que rien", Genre.MALE),
-    (11, 1): DayData("tour eiffel", "tours eiffel", Genre.FEMALE),
-    (11, 2): DayData("symptôme", "symptômes", Genre.MALE),
-    (11, 3): DayData("mamanite", "amanites", Genre.FEMALE),
-    (11, 4): DayData("cornichon", "cornichons", Genre.MALE),
-    (11, 5): DayData("zinzolin", "zinzolins", Genre.MALE),
-    (11, 6): DayData("jouet à bascule", "jouets à bascule", Genre.MALE),
-    (11, 7): DayData("bloc-notes", "blocs-notes", Genre.MALE),
-    (11, 8): DayData("routoir", "routoirs", Genre.MALE),
-    (11, 9): DayData("guenille", "guenilles", Genre.FEMALE),
-    (11, 10): DayData("lunette de soleil", "lunettes de soleil", Genre.FEMALE),
-    (11, 11): DayData("octavin", "octavins", Genre.MALE),
-    (11, 12): DayData("toque à trois cornes", "toques à trois cornes", Genre.FEMALE),
-    (11, 13): DayData("navire-hôpital", "navires-hôpitaux", Genre.MALE),
-    (11, 14): DayData("sesquiplan", "sesquiplans", Genre.MALE),
-    (11, 15): DayData("baldaquin", "baldaquins", Genre.MALE),
-    (11, 16): DayData("anémoscope", "anémoscopes", Genre.MALE),
-    (11, 17): DayData("clavicythérium", "clavicythériums", Genre.MALE),
-    (11, 18): DayData(
-        "certificat de conformité", "certificats de conformité", Genre.MALE
-    ),
-    (11, 19): DayData("bonnet de nuit", " bonnets de nuit", Genre.MALE),
-    (11, 20): DayData("atmomètre", "atmomètres", Genre.MALE),
-    (11, 21): DayData("pnéomètre", "pnéomètres", Genre.MALE),
-    (11, 22): DayData("marie-salope", "marie-salopes", Genre.FEMALE),
-    (11, 23): DayData("lettre de crédit", "lettres de crédit", Genre.FEMALE),
-    (11, 24): DayData("cithare", "cithares", Genre.FEMALE),
-    (11, 25): DayData("tramezzino", "tramezzinos", Genre.MALE),
-    (11, 26): DayData("ichcahuipilli", "ichcahuipillis", Genre.FEMALE),
-    (11, 27): DayData("journal intime", "journaux intimes", Genre.MALE),
-    (11, 28): DayData("harpe celtique", "harpes celtiques", Genre.FEMALE),
-    (11, 29): DayData("nœud d’agui", "nœuds d’agui", Genre.MALE),
-    (11, 30): DayData("cabotière", "cabotières", Genre.FEMALE),
-    (12, 1): DayData("pique-œuf", "pique-œufs", Genre.MALE),
-    (12, 2): DayData("revue de contrat", "revues de contrats", Genre.FEMALE),
-    (12, 3): DayData("grande surface", "grandes surfaces", Genre.FEMALE),
-    (12, 4): DayData("manteau de cheminée", "manteaux de cheminées", Genre.MALE),
-    (12, 5): DayData("charentaise", "charentaises", Genre.FEMALE),
-    (12, 6): DayData("chasse-goupille", "chasse-goupilles", Genre.MALE),
-    (12, 7): DayData("chaussure à orteils", "chaussures à orteils", Genre.FEMALE),
-    (12, 8): DayData(
-        "giroflée à cinq pétales", "giroflées a cinq pétales", Genre.FEMALE
-    ),
-    (12, 9): DayData("salade de phalanges", "salades de phalanges", Genre.FEMALE),
-    (12, 10): DayData("rogntudju", "rogntudju", Genre.MALE),
-    (12, 11): DayData("lixiviateuse", "lixiviateuses", Genre.FEMALE),
-    (12, 12): DayData("chaise berçante", "chaises berçantes", Genre.FEMALE),
-    (12, 13): DayData("chebec", "chebec", Genre.MALE),
-    (12, 14): DayData("boulevard circulaire", "boulevards circulaires", Genre.MALE),
-    (12, 15): DayData("bande cyclable", "bandes cyclables", Genre.FEMALE),
-    (12, 16): DayData("coupe-boulons", "coupe-boulons", Genre.MALE),
-    (12, 17): DayData("clé à pipe", "clés à pipes", Genre.FEMALE),
-    (12, 18): DayData("ensacheuse", "ensacheuses", Genre.FEMALE),
-    (12, 19): DayData("fulguromètre", "fulguromètre", Genre.MALE),
-    (12, 20): DayData("diptyque", "diptyques", Genre.MALE),
-    (12, 21): DayData("cucurbitacée", "cucurbitacées", Genre.MALE),
-    (12, 22): DayData("glassophone", "glassophones", Genre.MALE),
-    (12, 23): DayData("métaphore", "métaphores", Genre.FEMALE),
-    (12, 24): DayData("pentécontère", "pentécontères", Genre.MALE),
-    (12, 25): DayData("prépuce", "prépuces", Genre.MALE),
-    (12, 26): DayData("cumulus bourgeonnant", "cumulus bourgeonnants", Genre.MALE),
-    (12, 27): DayData("pyréolophore", "pyréolophores", Genre.MALE),
-    (12, 28): DayData("soubassophone", "soubassophones", Genre.MALE),
-    (12, 29): DayData("béret basque", "bérets basques", Genre.MALE),
-    (12, 30): DayData("vocifération sportive", "vociférations sportives", Genre.MALE),
-    (12, 31): DayData("armoire à glace", "armoires à glace", Genre.FEMALE),
-}
 
+# Day-of-year offset of the first day of each month, in a leap year
+# since the table has an entry for February 29
+_MONTH_OFFSETS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366)
 
-# Output of: cat lola.png | base64
-LOLA_PNG_DATA = """\
-iVBORw0KGgoAAAANSUhEUgAAAGQAAABkCAYAAABw4pVUAAAAAXNSR0IB2cksfwAAAARnQU1BAACx
-jwv8YQUAAAAgY0hSTQAAeiYAAICEAAD6AAAAgOgAAHUwAADqYAAAOpgAABdwnLpRPAAAAAZiS0dE
-APwAEwAT7lla1AAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+kLCA4YEjTHPQ8AACAASURB
-VHja7b1psGXXdd/3W2vvfc6d3vy6+/U8A+jGQIAECBIiBUMkzcmkpVhi0ZYrVjlRJfrgVBI7Trlc
-cexSla2oLDmuuMrRFNsSJcuiaFEiKYIEB5AgRWIgpkYDDTTQjZ7H12+80zl775UP58FWlHIZFvEB
-aPSquh/eu3Xvh/O/ew3/9V9rC2+wnTrxorty6cxcrzdxOI76e8aDle1Y1VOS9qa33kHSrVrn467o
-bB2Pq7O4olubdiuzOpTFv0h1fLjsdgaHbj2ceBuavFFfZGZy/MgPDlw5e/y/HfWv/nddb5NdFbwX
-US8ggqhHKXAWyBYwE1xoEU2o8WRf1ubKV8WHPyx73WdF7dv7Dx0+LSJ2A5D/Anv1xMty/Aff+pRU
-w18ocn9PmwFThdJG8cHhgiepJ2uBaEHQAsuQU8arIyUwLRhbQUVBCm1yUSDBjcaj0UMJ9/n+sPrd
-H/34XxzcAOQ/Y1cuni6PPfr1nxtfPfe/hVzNdlyipTVd7+j4gPcB8QWRArSFOo9TB5pAwKmCQUwC
-UlDVRk1BDi3wjuwdo+QY1PpgOTn7T3fetP+R6bmp6gYg/wk39b2v/N5H1s8d//fdut/yjCi9UHhH
-4RXvoPAtVNtAGx96+OCxXJOoEK+gDhFBDDQLkjMxGckXZOdJLlBJwZhuqmVyuDbMDy1dW/npj/30
-R4fXIyD6w3z42w9+5vbli6981g2WWmG8Tog1kjJmAlog0iYmxTI4dagodR3JGKoeULJBzhlyhTJC
-dIwLNd5XQA0W8TYi5FXXot/rBPuJmS29n33hyAv+BiB/5nSsXzr5Hhtc7kpap66GxCph0ZDaYJSw
-OqI5gyVSGpPSAGOMuYRJQr0SgseJoAiKgniycyTRBqi6RuuaggxxiGMMqfpHa9dWfvYGIH/Kli6d
-6U4U7b8ZqjXieInReJ1sCRXDAy4reZxIVY3khFJhjKjTgJwrkkViqkipRhCceHQj6KMlaEGhSkmi
-IKM5UXrohkzXM50Gw19++PPf+MTLz70SbgACnHvp6H1xvf/uPB5i9RoiY3IaYDYiE4k5E2MmRajG
-Nf3VNeJoSK7GxNGYFDMpS5NhGRiOjGKqGIqYERS8ZjI1mZoU1yCu0HVjporcmuoWn1u6eOl3Hv/2
-Y+8/dvRY520b1EfDoT76pd/7xfUzL/zt3D+Fl2VKEQpt0+p0EN+hcJM4c1hKiBmqQlEGQtEilG2s
-KDFf4H1BjjWprljvrzNKCfWBblEwPztBtkxUTyWBjJBixqQgUuLaM9RWxGG0mJw9N0rji+Lka5Ll
-offc/8Dzb0VA/lyBMafIeDSYHdeZHIVkGRccHiNlxTsl+0SuMyKKU0cda1x21MM+ISVcgvWqzygl
-Tpx4hVNnztBuBVzhKUKg5QOjceTwLTexb99+2qUjY1B4ElAzZjy+hNeW70nLo/7urmayysdT9v2n
-v/Xwc6HXffLixSv/bveBg48duPng6LoFJFYj1+q0FgaSMQmYdjGnoB2wFpaFmEcgimoA8YzimOH6
-iHanRb8/ZuX8eV46cYrte3ezaWGGhW0zFEWBSePCWmUJSVm5ssbDD36L2267lU1b5rHgyEWBLyDn
-EZYGED0qnm4REF/IKBe95FvvSal+TzUc/s2Vayt/H/jl6/eEWDLLKWIJTUrL9XDJSNkT1eNqweII
-AQb1gO7kPO2pWc6cPk1aWkJEyTFyYO9OFldXWe/36U60kWCo84RQ0B/2KWjT9iV7t8zx+DcfZMve
-gxw8fDN0e7SmPO22EeuIqmHVCBlCFk/ZmmIskRwLLrx6opUru++6BsRMNKu2k0W8gDOHWMKcYC5g
-WSizIUQq4Nljx1nYvJcdOw9x4fw5Xjr+Iqvrq1TDEcG1WR2sMbdtkk1bp5mfn0Jzgfclpo5hPaTr
-E4du3cuRF46zZcssBWPGdabsBEJo4SQChjMhOCWmIc4lrly7wtXzZzlw8FB/ZXnFT01PxUuXr/j+
-oM/i1Yt+x/ad83U9urBr1/70lgYEMct5HJGKJGMqyQQniA84cYwrJfg2i5cvcSWus7DzJq5cHfDN
-Rx5ibnqSGFs8/swRqnHFp/7yT5DiiGMnniSmARMtRcqSotdkYISC9ZxpT/R4x913o4ANV7FxIMYA
-RYQiowg5eUxSUxMlQ6Owb8c+4iB+7LnHj/z2b/2b37v0ud//3A5XpGJubm4QU/3ZhS0Lfwi8tQER
-DKgNq1EznAqOACmAFiyvDPnmk4/jWo7e/BxPnnyW54+foixbXDt6gqXlaxACt996K999+giuGrNt
-5xzDuMiZ5Wts3bqTOKxpGfhsWMhIYbTUUaoSkienFqotco7EPEZFIUequoZyktGwQqOyeWaeI888
-P//S+fOf+v4zT7P/ps386I+995Xp6d1/5733vv/z14XLGvXXcxwO10Qd6gQH+BxAAillJjZPc99H
-f4y1cc3RoydZGxREmebpY6dYq9e5/e5D/MRHP8y2iQlOHXmBR778da6NFrnpjk2cuXKJ2W3bmWy3
-ccOAN4+mCp8i6iuyKNVYMTIx9aGooa4pQokzZZyFXAXEdyALo8GAJx77E165eJk9u3fz/vvutkMH
-b/ql+x/4S5+/foJ6BldMPpec+1TUMQ4oXIFqJLkhI1djrqRX9PjI/Q9QVQVff/QpDt7+Tj73tS/x
-kU9+nN17t3Hsyef56rcfp6rh3KuXsHbNnl0dVi+cYvv+W3DtCUqmaEkFaRVJQiYT6zGiiSrVkA0t
-AuMqUfiClB2ZCC6irYKzF89x7OSLhNnZ6r4P3Ld++M5D/3Y4XP796yqob96xx55/qvCEQHSZ2iJJ
-RyBGzg5yiTqQyrFeX+PSpTVOvHyE86t9GA05/uJLvP+9d/CsKLk1yfnBBepBRe/ymOl2Gz86j6sD
-hw/PoV5I0fDSJAs5gRdIuUKdoL5LNCFaZn29j1IyqlYJbaGuao6dPsGP/8xfe3nfwZu+te/gLb8X
-Wv5b99/+kfF1BYj3IX/rK7/5eMJGsbJWJBFtDCIURRdLDVUoZLKOmd7S5sd+7B6+89gRTpx5lS99
-/o84fMs+Dt50C1VfeH5zjyd/8F3C5DyVm+S546+wunqOl499kUM338KB/duIFpnozkMFwSBXmagF
-o6ExSCNCR5mb30SdYLhurKUaQsH9H/7ID269555P7T5w4FURyddl2gswMzX/yFJ78hXJ5a1dC3RU
-EV9g9KAuyAI1Fckc64OaF44c4cKp07z79jt44cxpPvMvP0N3ssNoMGIYE6t1TZjpcvDWm9l57x1s
-n56E4YjV/hLaVUai1DaghSfXmapKjFNmaEZnZopNC9vI0eFUKNpjVgcj+msDJorprcNhfY+InLhu
-6xCA2+/96Nq5H3zv+yWTt3bTiJY0ZGFtEZySMTKZ8aCGyti9bYbNs7McP7nI/pmt+C4UnUR3uuD4
-6Ze59fBh9mzfztRUYG52moXZaYKNyNJjadSnS0E1qskpMxBlhJFEmd28QDHRoz8CzJHNo77L9Izj
-hSefYvnF01v2HDjw4+fPnv3Cth07BtctICKSH/z1X7g29AUqTVoq6siSUR8RMSQbLeeZnCiYm9rC
-hcvLbF+4nXNnljHtM7Z1tG1MFwvMb9rEVHeGg3v20hbIVc36aAmTyLg2qgiSHDlm1geRubkdTE1v
-wlxgnIyEgXqyKd6XqBTc/c77+O73v+Oee+aZHx+NR78APHPdAgIwsWXHc4sXT5FdIntBJaMWKZxr
-WrMmBOfwYvSrEaF01ONVnCyztnYF00zbd7hz106mui065QRlf0hKmXE2cg3RjEQgpoJRv2aiNcHW
-XduZ6MxQjTIpGSgEDzEnvGZivU6mxeTM3IWPfPyjn7u6uHis1Wrfe90DMjW3+WxZyMiPY8slpRDB
-ZRAVonnAkcUxNki+RTlZ0krK1oXdpNxneXWF9f4KayuXqNYus3VuC66IpOywrNTZsTYeM8ojWr02
-nelJelObiFKyUlVYnXEa0KwEUUonIFCbMU4Vdf9qZ+eeQz84fNfNvzO7eVu+rmMIwNWzL72EpiuS
-q50yMpyUBOcZolQEVNvE5EmqSNmjVU7hUQqJJBsyP7WJeRvgbBtL185zZXkF6V+hdBO0y0kGtPAz
-8xyYn8erMBhHqixQV6hlMMHhEBSSkDJIrShG6ROxHk6eOfrUL188M7tn8679//i6B6Q9Mzt2y5PH
-x4PFnUrGWcZh1KZECiyVoG0oS7QsyS7gQhtVQ+kS4ypePc712NzdTN5eIwYuebx0yKHTFHqxZtgf
-oFLiEURpCsKgZBI4wbCmFQxIzkiKeKdiyc0Mlgf/y7l45rbnn3z2X03NTj+4fc+uN60q8oeSAVXV
-wH/ts//n/7786nN/v0hD6WqLlk5QuQlSmGRsLZL2kKKL94pzxuRkh1A4AkrhhJjGkKwp/0nkHEk5
-EpNRR4e3ksIEsyE5Vah5siYQaXoxaPNZzXgPHk+qoE5jsmQkdIguUEkmOz+YmJ7655t37vm1g3cc
-OvlmBOSHkgEVRSdOTW59NoRuwpXkUFC5gKjHREAddcoMBmP6a0PWV1ZYXl7kyrVLXB2ssDgeMZKA
-+DaaHSEFCmtRhh5lt0ur9LTUKNVQzZgaRt4QUghOBLFGAKEGqTbqcU0mos7wakhd46tEqCOhrjuj
-laW/e/nMq79y9IkfHLzuXBbAcP3yUe/dWhozY8nIlgntgIhHrCTVmToNWOqv8tyRJxkM1pifnWd2
-6wKz83P02m22zs0x1+vgFLAEyRGspNSSnPpoyjgLiC8b95T7kCqUCJaxbORcgrQQMuiwoXFwiDjU
-lKAtsmSqWLnR4vkPXuovfv7hL/7xz99273s/O79pJl0XLgvgqW/89tbzz3/vO6PFM/taLuCYQIs5
-ap0kuznQwKCqOHHmBMPRGr1WQZGVnI2V/oDLK0tIgG0L8+zatsCOzVuYbE9TaheHIXFMrhLJCsak
-hjOzdaSOiDgMRQmYNoAoicQakYxZAeZolxOQlFCAc5nV/jVyKOm7icomJ395cvPkP3vvve++fF0A
-AvDFX/rvvzhaOf/xXuFxqY2Gaaw1Q3KToCU1jsvLy5hCp1UyUZaIAD4wFljpL7O0fIULp05x+fQF
-9m3fx12H3sHOXTtpdVqMR5E4Fqo8gmKEktBayEkb92hCFoeZ4FMEGRIlkyXgNdB2HZ595ggvnTjG
-A+97D/Nz09TmWHcdVp2inXBiYWHL/7Fp8+Zf331gb35LuyyAVnv+ZOwPTTBx6ppfaVpBZUSijeoE
-E50WmYIQAtEMFwxRKJKw0J1m5/QUt+/cQxwmrl1Z5smjz/LVR77FXe++l727D9LxjVA7OSVmhxPA
-CwnDNmgaErhsOHM4B85BAAqBXhkgVgyGKyA9VKHtMmZKGqR9/TOX/0Xq15888sTRv97utFYOHN5v
-b9kT8p3P/sv/5vyLT/6TkMab2qKEEMgqaBHIvkttXcbjgrr2JPGId+ATpSso8JRBqPOQshUge5wL
-1GnMaDzi8rVlXnrxJJNFyZ133UpnpotXh4wTiJE0kS02v66oFNEh2WEhIR4sKpoDDgghEMpItEjC
-U5mjMiGhqC+J0rIUytXZrXP/cHrz9K/tObin/5Y8IUnHz9N2gziI1BkkK6olSgEojoyzihwjOTty
-LhjHzFCgpYKLEfWRwSjhtURjQsiIK9i6eTvb53exuniFC+cuUl2C6V6XmU6PVqtEC8X7ALmhbbIZ
-ScEk4wTEecw5MpAtk4dDTBxSeJxTvI4wEqhSEERynBpcuvaLq4tLu5978ug/uu2dty6/5QCpYv+s
-82VHcoHkUaPX1Q65EsiGSIXGiGYj0CYnIfhAyoEUjZiGaJ1AW+AS6sY4g6Ad1AJEo9Wdoz05xSAO
-WFtbpxqsENQIwdPqtei0SzpeEe/ICLUYRSU4hLEzJHhKSzgKZGOCKzuDIuB9gZnhSHhq6liHug5/
-a/HytT0vHn3xH7e7nSd27dlpbxlAtm6/eWl44eqxGOMmp4bTjEqNim8E2BhOIuIN0ZqYh+QUG6mp
-eMQ5khkWlZQgSSZJJKqhjHBATjVigjmh7HUh1mCJUU6sr6/ASqTloOXaSGjj2gXmC8QqkssEEZwv
-SQmyKVnAUkZqQcyBllRkMiNykwS70dr6J84c7x/qTHZ/Efh/3jKA5JiyxPwFMd6vKjifURdRYkPJ
-YygJkYiQSXmIarsJxtmR64QvCgxQU5w4sosYFYhR5xocmHjqJHjvcd4R60Q2h+AhJ1LODFKmrvvE
-4TqaMyqZmI1hf4yLwtxMh5mZzbQ603RaJd4MESEJFM4hBhHD1Kjr2knKN69f7v/61//gjz80MT/3
-D9/9/ntffNMHdYAv/NP/+WertWu/2vY16iI+NK7BtI36VuPjc8LMqKORcGQpMC3JCphHrI1IQW2J
-WhPiFETIKSGqmAayBLAxWEIQsjVqeYu54bmAymoqG6M54k0gg0TIgzFry5eJVSbXxtLKMrUktFRc
-CLQ7Hcoi0Op1md+5i7mFbUz2JhkOK8bRMTZebU92P/CBj33wxJv6hABE58i+8csmhlrGa8JcaqgM
-dXjnIYNTI1skMaaWSBLBUpMuqxSIQEqR0TDjfIHTAnUOp4GUFckBcMScySmjXvC+oB6PSQIER1CP
-ZMNFhyaHI1NOFcxPdnEp03aBHMcsry6ysrLM5fOXOPvMs4xHq0hwVKFDd9su9h66jc279rP7ptsg
-VntSyv8A+Jk3/wn5v//eXx2tLH4mpKG2nKBWU4aS7NvE7HHimn4JSk5CzGNqEmOBiOA0NNmZecQF
-cJ5kSk4K2ZETxCyYOQzBxEC1UcKnTJWTFe3y+d705Nlk8Wp/fem2OB51XfZzpW+3XLYSS+ZJzpui
-0bAYCQ7aHkLO2HjE+tIiK8tLnDp7gZMXrnJueZW1ssvC4dvZsX83t99118Wde3bd98AHHzj5pj4h
-ocRGUmMWkbxBg1sDAE4hZUAwM8jgCah61OemXyIOSc1DQjJGRFUQ55AsqDlESmI2omTGKZKyMBpF
-BlXud6dnf2fXwf3/fGpu5lh/sJrPnaxZHg74C5/88fbihUu3nztxYn/RbkUV21yN4/ba2D8eDG9t
-F6FtYsFyDCV0eps2d+cl6f53JeqYGcSKdQmk3hRLdU2n5cter8Ob3mVlqGowFUGyUIpDkmAO8E1L
-V82BGaKG2RgxCNmhUfEacAKmiSSR5BvSsBqPm1+zKBJaIE21rqEgxZIydI9M9Wb/h10Hb3r0rh99
-3/9/Mvfv/fwAeHTj9f8xM9OL587Pqsh4OOx3F8+dX+hfOLvNT3S25NEwFshMr9PeMmvaougM9nUn
-qytXLj18z3vuPfmmByQl96hR9NE8mS0TE4gZWWsMh8M37iZlcAYYSkZSxmVBqjHqHKZC1kyuEykl
-iBGyIEGJlklOSRQMq0BnestT7aL8yMf+2l//cxGDGzqtqxt/rgEXgaffsv2Q16y/tlKMlq+cL0NR
-J4MaqJyS1JHFMGoyFdkimUSyyFhh5I3Kj8h+HWkNsbKiLhK1NrWCuEBodwjtNglP1ja1lfRHLUxm
-nsZaf24wrssW7mvW6U3WOw/fJxeOP9YUXBJI5hBRRBJIDSYgDgREUkMH5kRVj3DUlL7YGIt2IAFT
-BbWG8sDITqnN06+gPbVpaX7H7v/x/R//0HUFxht2QkTElk8fQQ1KaRYEZIxEwiSjkgjeUK1RrXGa
-CSkjVdOMirWnv54YrUVskNGxodGhlGQ8Y4SBCas5kbu91Jub/uTE1NS3uQ7tDYshFgNUI4iG+ogL
-CpkGJC1odAl1MwKdFKHZDmQIRoHlRJ0hVWOkzmSJpKCkoEQV+pZZx+iU/uc+9JM/+R2uU3vjgvpw
-hKTm8SIZdRsUR3JodAiGE2vmC5OSNoY71QyzJoBXsaKONSmDWSAFD+0W2ZeMtKAzM3vl5lvf8SDX
-sb2B+0IqRGucZESMnBuOSMVBEjaW/gBCNtl46GDJwDKiCdGE+dQQjAZJDHJo4g+BalA9/Z73PnDm
-egZE36gv6vSmD+RclcgQpUaSEevcpK5eQKUJ0JkNEtFBDlguiBaoxVOrYKqIE/BKtuY76gpS9ExN
-L1Rc5/bGFYa5eh859RDDDFwIuNzMqKOBOiXITZalopi4pmqXpnpPuaZKQp2MlJqWbJIC50qQEjNP
-tzvxmzcAeZ02zpXLmjFRUjKCc83SAByJgKkHEpIygmA5kdOG4C1nsoG6gHNKrpvsC2kW0RgB79vE
-Ubx8vQPyhrmssdp07UCLgIhCbuJI0wlR0IC4gDiHCngPwRlOMkrCScZ7adquwkYNo+SNmOOL4tX9
-t9xy9MYJeb1ZlvgDpiUp1xSqeBWyANKoS0Sa4A2NOr7pm9eQE+SI0wwpIjmiCDiHqCeKIF5pdduv
-3HbPXVduAPL6k6ybXPIN2yuG5YS5TE41qCBOGlA2qm9LNPJoUbw66pywnDHLzWYIVUSVrEIU0uzm
-zU/wNrA3DBBfy4KNwAdFXNrQ4SZUpWnlmoBkEmDWdPbUByQbqRpjGQSHEwHTJj3eAExVXayr4dsB
-kDckhhz9kz+ayqkuUoqYafNAU0KSoihOFZX/OMthQC1GLYkoNVGqpuGE4ijwWm6ckIxpDRqpq8GV
-G4C8HsrETLftu71vGvGlYAritGm5ysbGUQVRUBWcKE4U9QqhqTec96j6ZrrDXAOovVZIKohfFnEP
-3wDk9RGLeWZhb1TAe4eogCtAC5w2FXiWRJJEMkNM0RTIORFTTUyZlAQzvyF0UESa73ISUCkRyu9+
-+Cc+9eoNQF6nffVX/+5hsdGs2rhZRkNo5JxETGqyxEZ7iyDZ42LAJY9maV7mcVogIthr7VsB5zzB
-tynKSdfqtAdvB0DekKA+HF+72/LKtJrgpIXEAtUCNGA0a/6aaj5tpLaN/qqwEkRILhFjQp1sLMQU
-sjUxJSbL3W77Id4m9oYAIvjdFjPqPF5Co1jMgvoWzoPliIohAiaRrAbZoZlGKG0J5zJm1qjRs5Cz
-o4pGcpZTff1X6G8sIDGcK/wkwSlmjijN7Lg5w6M402ahchayKNk5zHmyZFKMZKkaMFAsNZKfWrSR
-mWpw3jl/A5D/Aou5uIdKqIMRvILLiE9kbWh0Z0BqNjEIBSKBbDVJMnhDXbM9Tl4bwElCyopJsz9u
-z80Hn327APKGpL0m+Z3qPSkJOW0UdgpJremHm0BuBG+WdaNWySCJrEZWQ1wDgDmHFgXqA847VHI9
-MT158QYgr9Me++pvarZB2/uEc4rlDTV5NoS0UUwEoI1oi2RQpwrTjEkm5USMzQJ/M3DqCT5spNCg
-quc6vcnBDUBepy1eODFtFntQ4dQIwaGy0a7Nhlgzzi80C5dFDedTk9aK4lBUmvdVtGkjYqhrhm5C
-p6xfeOrRlRsx5HVaXVcHUopbYhxTqCK0YaPm8IQNDiuSqV8rJBERXDKUZpQgWZOrRRoRdjQjqhLV
-MzU7d2HLrt3cAOT1xhDSpxXreG2okpwFosM5RdWBJXKuCK5pzTZr+qwpHFNuGF42aBVtlItiIM4R
-UZNQPPeOd/+I3QDkdVoaj/eLCU4CIg6y/gcaBG1OhCUa4VvW/xArstXgrLkNITW36qCK04AXh9MC
-smN1ef1V3kb2Q8WQh//g/9rpQ/tuZwEx3yRODpwXNuTvoIq4gmSBaAXJCrI5omRqTWRniPcNFS8N
-sSgbU1FiRZydXfj+2wmQH+qErC0u+Xowbntt7vcwWs0mOW9kaWYCX+ttmIJIbhSlNGHGctNfV3VE
-jLgxsp8VsiScFnnbjm1Xb5yQ12HHn3sitKc2b88Wp5p5jo2LWMiQa2Rju89r8sUskZohkSFZBzjN
-lNpsBSKnZuWSN5Jr6hJ1nk63d/TCqVPnbwDyOuzgbXfX/ZVLt8c4IudIzorhQAy1hHvtFERDkqEG
-SkaJqESURpslpuTYyEvNIItRb+ixVMMLO/bsSzdc1uu0Ag5VqSJgCK4Z5HQCCs451GgKxAwqzUPP
-2bCsJGmuOMrQNLKaxRyYerJ4cg5U42p5ZXnVbgDyn7GHvvxZP7h2atL3lw6X2XCJ5n5CVZJK00+X
-vFFZgGej4NtoUOUsVJYadfzG/xWaZf5mZBHqnNHgtvfX15Q30e0Fb0qXtXluPhehqFMaJ7GMx5Fj
-s7sqZyPlZoo2ETGtyTomSUXSSNRM1OZ+BSORpXnftEY27gHBhGSCL4uyOzkhN07If8K++JUHtw36
-qx/7gy//8d859dKT4fadU5s3B2FaCrzPzfV4UZthTd9cYaFikGvMEmaOZEIybSgVEZBGnZLMmmyM
-0EhH8WRktPeWm0og3gDkz9iLz78cnn7u2Z9/6BsP/ddP/eDbPg+vsXIm8MA77yJ0PDNlsbF+TxsF
-fM5oKhpyMVtTEKpuAJIBQywjllD11LmR/mZp5D8mjhjZfeXS1UPAEzcA+bOAHHulNVipbj114qqf
-nNlLmN8CMuC3v/w93nnzDmbb02yabbFr6x5CqLA8ppAJWjqFJcgIUSNpY29iTGsoTcA3PNkFxqmi
-in0qgzGRcnJqz8rqtV1PPXnkyF3vvH18A5A/ZcNx7PQmt0zu338vT71wlJltBa8uHuPmD36Ay+uX
-ePylk7wrHOTlq8dZXX2ZO2/bw3SYJaQ+ZShwPpOkIpojFCUx9bHksVqayyglkFygdv9x2+iDD355
-5vCVe/7X9953/+4rVxZ/ZdOmucENQF6L/q7sjar6G6trS4cuXLrMVSuhO835NMXF1UW6Ow8z2H6Q
-Y48/yabZTRxdW6anS6S1yEJvnt3b97FytcKHFnmwgviIRcNlyHGEui7DpORgRKkYJcdqNSW/+/mH
-3r00qm4euDj1u9/8yj/59AMfHr/tAfnOw0f81aurH3zl3NGPvfjiE6wsniRlx23vuIXpdos0tY2q
-9qzaHFfyDP31NQbthJOrkPocO7fOX9hxK6euRTQK7ZYw0XMsXbkCNmJ6mvLuWgAABwxJREFUqk1/
-bcQgzkDHc+zUSxTTC+TeFrxkvv7kY1MH7rvzZ+enJr4OPPK2B+TUyUu7Xen+6rkLZ/fObZ5kpd9i
-xCK3bffMTVQU09tAJ6HosnDvu0i+ombA2bMn8FMw6hrfvVKzlicZr/bZP7GZly5dZnm1hUikPewz
-0d7C1ZXI7oWt9HsjmF3gyvISg2qdw/v20up0yGm464bLAlozUmTqzjANWB/1GY5WcGkJd+0UuycL
-ehnSeJ3MJDvmJujnQM4FN+0/hAWhnzPLI6NqTzGaGSNUdOd2QxfWBotIq+bU5au4osWZpUXOrKyz
-qbVOf/Uid9x6gA999CPjlPPf7rb9524AAlS2Nn3uwoV7jr74LLnI3P3eu1g9/Tz1lSXc7DK9UFEW
-AQlj1upl5sseDhgMBtSDEZUZQxyjDEyVjFJFNqVut4lzO6j9mHrzHBQ9Rlaye8d2brvlAPNzEza9
-eepMTf6VpauXH/noA3+lvgEIMDc7s//pZ5+1C0tXZO/NOzlz/jQPHD7E1uA4+dwz+B3b2Lp9AWxE
-twy4kPFE2m3DVR1EStZGIwZphZgzlcuM4pBUCxJ6DGsjOiGOxkg5B+UkW3xxdqps/epMKP5tfzx8
-5VN/6a+8LTit1wXI2sraHUuLS2nT7Ly/duEi+2Z6/Mh7buemuWm+MrzGy5cuUcxO0PWKywUFBWUQ
-KGuc8zjfRloBNzRiGpEVxllIRY26VSpr1nE4mW6W8CNM4U7und38S3e867a3jeLkdXNZqyv9L4k4
-3wptrl24xvz0NNt27+Qbzz7FaHqa5dDj6ZcuMBwImDDsr5GG42ZBvtX0q1VGNkBbSrvbph1atIse
-nVaPdnC0g9JrtSlCIJSCK4yyHToTU13H28xeXx3iQzWzaTPF+bN0OrN87ZGj1KnmpjsO8eLZUzxx
-8jLv3ruNE9dWqc6d4x037aYeVphzxBwZ5RFRAi4UG3Q7eFFUQtMLMU+qu4jrktVDSCwuX77z1On2
-h4B/fwOQP2O9qe54fstcXF0f+Nvf9SO88sJzfP6RVzi4HDh3ZZFtOw7j9yzw0FOPk6pFWrOeXUXJ
-ZOpQtErKUOKyY33UR0sBqSgkN80rKxArMArGVYSOMKpWefCPvuPed/+HPv6FL3z5+U984qPHbris
-P2XBy6VN87Nf+/CHPswLx15hattu/vKnfoaVq5HLp1bYNLebpbrkbK6JWxf4+ivnuTgxzZ+cfIUT
-S9dYXFmiYMh0y2h5I2iBWYloh1EUag+pTNBN1MWIzkTARn2effKZv9Epu49+55Hv/0+XL199W9Dw
-r8tH/+5v/dbaT3360/smu9P3L6+OZNOOrTz75ON0NbF7YYILZ19BiWzfvJuWbubm2+5lPWdWYp+P
-feKT7Nm5lzwYcPHyOWoRXGsSyS3aZYfeRJuy6+j2HE4yhfc4c5x46QzjERrKVnnu4sXzviwe/df/
-6jfWb5yQDYuD8WdCtmfvfset9K9dxkni8B2HmZwsqVbPUgyvMivCbdt2sXfTZs6cOMHhO2+lt2Mr
-X37qOF/4wQVOjab48pEz/P7jR/jtb36dFxbP8czpF/nW9x7m6Sef5vz5Ya5GnZXz59do9XaSZJrP
-/LsvcPzVU59eXV//B4899kRxI4Zs2N/46U+f/Ne/9hsvu+H6nbfv2c6h/bt54onHefnESe5/4AFm
-phzHn3uetqyxejWzow1HHnuC8VDI5STdm/fxysVVTkiHJOu0t3T5oxOnSXGZtLbCPTO7+dh77kun
-ri6dev6ll+7wO/dw7dVFdG4ry9G3182ly0vXv9t63WnlH/7WPwsyXv+Z8dLVA13v6RZd1tcqit48
-0ws7OXH2NCcvnebue+7g4rnTvPjE0+hYOX16keVVZZTa5KLH1PwC6hzzu/YxKia50B/jpyaZXNhC
-bJVukKstL5w9yVKGxUFk6+4d3P/BDw7a7eLrP/nhD3ztxgkBPv/Z3xDrn9/f0fGdW9s1MfeJdeDe
-Ww6y5tu8ePosr15I7Lr5Rxi3tnDs4ve57Y73sWuiw4Pf/CaDY6fpTRyhPbmJrXv20fWCXBqypezS
-mtrJ/CYlDtbJ1ZhW2Wa4usYoCRdOXuPQ/p3MTpcvVYOlX7qR9m6Y5VoceXsar7YLG9KSgHihFRNl
-nfEzW9j94Z8il57HH3uUQdyGzB3k9MppwsIsH3/3Pcy1enz1S1/j3DMXMBNaRZuaEt8V6jM1kmoe
-evI5VqvEmYsDVoc99t92J+cunGZ56fzS3/qpn1q9AQjwve99s33+1eP/lXfdnzO70ml3Mo4Bqp6e
-elqV0Ck6rIinwnPP4Ts5fPudDOIaj146zfr0DOuTba5cOEt7YYot5TZyJcy1jTPnLlJ4oS1w4coS
-FF1yUrZuO8D27k6Wx4kDCzsoe1OTZiYict3zWf8vS6Jwl06WaWMAAAAASUVORK5CYII=\
+# One line per day of a leap year, formatted as singular|plural|genre
+#
+# See https://github.com/tobozo/SaintObjetBot for data credits
+_PACKED = """\
+veisalgie|veisalgies|1
+ankylostome|ankylostomes|0
+apex|apexes|0
+arlequin|arlequins|0
+bengali|bengalis|0
+bouquetin|bouquetins|0
+cancrelat|cancrelats|0
+cerf-volant|cerfs-volants|0
+colibri|colibris|0
+dromadaire|dromadaires|0
+embrouillamini|embrouillaminis|0
+fauconneau|fauconeaux|0
+gambette|gambettes|1
+hérisson| hérissons|0
+javelot|javelots|0
+kangourou|kangourous|0
+lampion|lampions|0
+manuscrit|manuscrits|0
+quignon|quignons|0
+tablier|tabliers|0
+zorglub|zorglubs|0
+pataquès|pataquès|0
+bobèche|bobèches|1
+zézaiement|zézaiements|0
+flibustier|flibustiers|0
+mirliton|mirlitons|0
+craspouille|craspouilles|1
+zigouigoui|zigouigouis|0
+faribole|fariboles|1
+pantouflette|pantouflettes|1
+zinzin|zinzins|0
+bibelot|bibelots|0
+ukulélé|ukulélés|0
+grigris|grigris|0
+crinoline|crinolines|1
+turlutaine|turlutaines|1
+boudeuse|boudeuses|1
+tralala|tralalas|0
+carambolage|carambolages|0
+frimousse|frimousses|1
+catafalque|catafalques|0
+chicane|chicanes|1
+barbichette|barbichettes|1
+croquignole|croquignoles|0
+rouleau de sopalin|rouleaux de sopalin|0
+clavicule|clavicules|1
+bambinette|bambinettes|1
+sporange|sporanges|0
+fléole|fléoles|1
+goubelin|goubelins|0
+bélin|bélins|0
+grébiche|grébiches|1
+pipistrelle|pipistrelles|1
+badine|badines|1
+guttule|guttules|1
+sautoir|sautoirs|0
+tourniquet|tourniquets|0
+grenouillère|grenouillères|1
+torsade|torsades|1
+calicot|calicots|0
+gousset|goussets|0
+tournebille|tournebilles|1
+gibelotte|gibelottes|1
+cabestan|cabestans|0
+mélopée|mélodées|1
+galurin|galurins|0
+joug|jougs|0
+cabriole|cabrioles|1
+attache parisienne|attaches parisiennes|1
+bac à charbon|bacs à charbon|0
+béquille|béquilles|1
+boussole|boussoles|1
+caméra argentique|caméras argentiques|1
+canne|cannes|1
+cloche|cloches|1
+clou|clous|0
+coton-tige|cotons-tiges|0
+disque vinyle|disques vinyles|0
+encrier|encriers|0
+fer à repasser|fers à repasser|0
+fusil à pompe|fusils à pompe|0
+gourde|gourdes|1
+imprimante à marguerite|imprimantes à marguerite|1
+tendu-de-majeur|doigts d'honneur|0
+machine à écrire|machines à écrire|1
+poignée de porte|poignées de porte|1
+savon de marseille|savons de marseille|0
+stylo à plume|stylos à plume|0
+téléviseur cathodique|téléviseurs cathodiques|0
+urne funéraire|urnes funéraires|1
+balai|balais|0
+microplastique|microplastiques|0
+bougie|bougies|1
+cabine téléphonique|cabines téléphoniques|1
+canapé|canapés|0
+carte postale|cartes postales|1
+ceinture|ceintures|1
+engrenage|engrenages|0
+escalier|escaliers|0
+monogramme|monogrammes|0
+acanthe|acanthes|1
+humus|humus|0
+entroque|entroque|1
+fourneau|fourneaux|0
+ampoule multiprise et rallonge|ampoules multiprises et rallonges|1
+alésoir à cliquet|Alésoirs à cliquets|0
+clapier|clapiers|0
+taloche|taloches|1
+occiput|occiputs|0
+diodon|diodons|0
+tricorne|tricornes|0
+spume|spumes|1
+manchon|manchons|0
+limaçon|limaçons|0
+levraut|levrauts|0
+gymkhana|gymkhanas|0
+dosimètre|dosimètres|0
+queue-de-pie|queues-de-pie|1
+clé à pipe débouchée|Clés à pipe débouchées|1
+perruque|perruques|1
+traille|trailles|1
+tripalium|tripaliums|0
+pastille|pastilles|1
+francisque|francisques|1
+pirouette|pirouettes|1
+marmouset|marmousets|0
+pédicelle|pédicelles|0
+hypsomètre|hypsomètres|0
+lambrequin|lambrequins|0
+cribellum|cribellums|0
+hélicoïde|hélicoïdes|1
+quenouille|quenouilles|1
+zythum|zytha|0
+sarbacane|sarbacanes|1
+turion|turions|0
+blaireau|blaireaux|0
+sémaphore|sémaphores|1
+crispatule|crispatules|1
+zist|zists|0
+chiquenaude|chiquenaudes|1
+sagouin|sagouins|0
+borborygme|borborygmes|0
+zéphyr|zéphyrs|0
+schnock|schnocks|0
+pendeloque|pendeloques|1
+falbala|falbalas|0
+nycthémère|nycthémères|0
+houppier|houppiers|0
+suaire|suaires|0
+jable|jables|0
+goulot|goulots|0
+bourdalou|bourdalous|0
+zibeline|zibelines|1
+turpitude|turpitudes|1
+carafon|carafons|0
+roubignole|roubignoles|1
+cantharide|cantharides|1
+pédoncule|pédoncules|0
+élytre|élytres|0
+cressonnière|cressonnières|1
+araignée|araignées|1
+sarment|sarments|0
+argousin|argousins|0
+poudingue|poudingues|0
+pandiculation|pandiculations|1
+gaudriole|gaudrioles|1
+chenapan|chenapans|0
+carabistouille|carabistouilles|1
+baliverne|balivernes|1
+histrion|histrions|0
+babiole|babioles|1
+pétouille|pétouilles|1
+baragouin|baragouins|0
+patatras|patatras|0
+alambic|alambics|0
+billevesée|billevesées|1
+rigolboche|rigolboches|1
+turlupin|turlupins|0
+turlurette|turlurettes|1
+guignol|guignols|0
+bille-molle|billes-molles|1
+brimborion|brimborions|0
+mirliflore|mirliflores|1
+clapiotte|clapiottes|1
+gaffophone|gaffophones|0
+légumineur|légumineurs|0
+micro-onduleur|micro-onduleurs|0
+frite-magique|frites-magiques|1
+extracteur du potentiel de point zéro|extracteurs du potentiel de point zéro|0
+réveil-tartine|réveils-tartines|0
+horloge-moussante|horloges-moussantes|1
+canapélicoptère|canapélicoptères|0
+éponge-lumineuse|éponges-lumineuses|1
+spatulon|spatulons|0
+vaissellier-volant|vaisselliers-volants|0
+boîte-à-bêtises|boîtes-à-bêtises|1
+télé-poubelle|télé-poubelles|1
+baignoire-parlante|baignoires-parlantes|1
+armoire-à-glissade|armoires-à-glissade|1
+pierre manale|pierres manales|1
+grille-pain de l'espace|grilles-pains de l'espace|0
+robot-raccommodeur|robots-raccommodeurs|0
+fourchette-à-comptine|fourchettes-à-comptines|1
+pantoufle-réactive|pantoufles-réactives|1
+coussin-péteur|coussins-péteurs|0
+télé-orbitale|télés-orbitales|1
+brosse-à-dent sonique|brosses-à-dent soniques|1
+couette-intelligente|couettes-intelligentes|1
+pyjama-à-histoires|pyjamas-à-histoires|0
+bol-à-mystère|bols-à-mystère|0
+tabouret-téléphone|tabourets-téléphone|0
+miroir-savant|miroirs-savants|0
+tapis-volant d'intérieur|tapis-volants d'intérieur|0
+oreiller-à-musique|oreillers-à-musique|0
+papier-peint interactif|papiers-peints interactifs|0
+xylophone|xylophones|0
+guilloché|guillochés|0
+djembé|djembés|0
+caipirinha|caipirinhas|1
+tzatziki|tzatzikis|2
+karaoke|karaokes|0
+kantele|kanteles|1
+haiku|haikus|0
+colchique|colchiques|1
+molinillo|molinillos|0
+quokka|quokkas|1
+duduk|duduks|0
+balalaïka|balalaïkas|1
+fajitas|fajitas|1
+bobineau|bobineaux|0
+fjord|fjords|0
+tsampa|tsampas|1
+qipao|qipaos|1
+boomerang|boomerangs|0
+cachou|cachous|0
+sac à dos|sacs à dos|0
+brosse à dents|brosses à dents|1
+lampe de bureau|lampes de bureau|1
+tapis de souris|tapis de souris|0
+pot de fleurs|pots de fleurs|0
+brosse à cheveux|brosses à cheveux|1
+boucle d'oreille|boucles d'oreilles|1
+manette de jeu|manettes de jeu|1
+tapis de yoga|tapis de yoga|0
+corde à sauter|cordes à sauter|1
+haltère|haltères|0
+trottinette|trottinettes|1
+sac de couchage|sacs de couchage|0
+réchaud de camping|réchauds de camping|0
+chaussure de randonnée|chaussures de randonnée|1
+taille-crayon|taille-crayons|0
+agrafeuse|agrafeuses|1
+aspirateur|aspirateurs|0
+lave-linge|lave-linges|0
+sèche-linge|sèche-linges|0
+machine à coudre|machines à coudre|1
+serpillère|serpillères|1
+tronçonneuse|tronçonneuses|1
+débroussailleuse|débroussailleuses|1
+motoculteur|motoculteurs|0
+râteau|râteaux|0
+clé à molette|clés à molette|1
+scie circulaire|scies circulaires|1
+détecteur de fumée|détecteurs de fumée|0
+caméra de surveillance|caméras de surveillance|1
+moustiquaire|moustiquaires|1
+brise-vent|brise-vent|0
+balcon|balcons|0
+jardinière|jardinières|1
+buisson|buissons|0
+haie|haies|1
+système d'irrigation|systèmes d'irrigation|0
+thermomètre|thermomètres|0
+hygromètre|hygromètres|0
+luxmètre|luxmètres|0
+anémomètre|anémomètres|0
+pluviomètre|pluviomètres|0
+baromètre|baromètres|0
+chronomètre|chronomètres|0
+microscope|microscopes|0
+télescope|télescopes|0
+spectroscope|spectroscopes|0
+sac à bière|sacs à bière|0
+ohmmètre|ohmmètres|0
+ampermètre|ampermètres|0
+voltmètre|voltmètres|0
+oscilloscope|oscilloscopes|0
+fréquencemètre|fréquencemètres|0
+analyseur de spectre|analyseurs de spectre|0
+circuit imprimé|circuits imprimés|0
+disjoncteur|disjoncteurs|0
+machine-à-faire-des-trous-dans-les-spaghetti|machines-à-faire-des-trous-dans-les-spaghetti|1
+morceau de bois|morceaux de bois|0
+pot de colle|pots de colle|0
+paquet cadeau|paquets cadeaux|0
+cacatoès|cacatoès|1
+harmonica|harmonicas|0
+bigoudi|bigoudis|0
+dent de lait|dents de lait|1
+bonhomme de neige|bonhommes de neige|0
+marteau picoreur|marteaux picoreurs|0
+bande magnétique|bandes magnétiques|1
+punaise de lit|punaises de lit|1
+carte de voeux|cartes de voeux|1
+moins que rien|moins que rien|0
+tour eiffel|tours eiffel|1
+symptôme|symptômes|0
+mamanite|amanites|1
+cornichon|cornichons|0
+zinzolin|zinzolins|0
+jouet à bascule|jouets à bascule|0
+bloc-notes|blocs-notes|0
+routoir|routoirs|0
+guenille|guenilles|1
+lunette de soleil|lunettes de soleil|1
+octavin|octavins|0
+toque à trois cornes|toques à trois cornes|1
+navire-hôpital|navires-hôpitaux|0
+sesquiplan|sesquiplans|0
+baldaquin|baldaquins|0
+anémoscope|anémoscopes|0
+clavicythérium|clavicythériums|0
+certificat de conformité|certificats de conformité|0
+bonnet de nuit| bonnets de nuit|0
+atmomètre|atmomètres|0
+pnéomètre|pnéomètres|0
+marie-salope|marie-salopes|1
+lettre de crédit|lettres de crédit|1
+cithare|cithares|1
+tramezzino|tramezzinos|0
+ichcahuipilli|ichcahuipillis|1
+journal intime|journaux intimes|0
+harpe celtique|harpes celtiques|1
+nœud d’agui|nœuds d’agui|0
+cabotière|cabotières|1
+pique-œuf|pique-œufs|0
+revue de contrat|revues de contrats|1
+grande surface|grandes surfaces|1
+manteau de cheminée|manteaux de cheminées|0
+charentaise|charentaises|1
+chasse-goupille|chasse-goupilles|0
+chaussure à orteils|chaussures à orteils|1
+giroflée à cinq pétales|giroflées a cinq pétales|1
+salade de phalanges|salades de phalanges|1
+rogntudju|rogntudju|0
+lixiviateuse|lixiviateuses|1
+chaise berçante|chaises berçantes|1
+chebec|chebec|0
+boulevard circulaire|boulevards circulaires|0
+bande cyclable|bandes cyclables|1
+coupe-boulons|coupe-boulons|0
+clé à pipe|clés à pipes|1
+ensacheuse|ensacheuses|1
+fulguromètre|fulguromètre|0
+diptyque|diptyques|0
+cucurbitacée|cucurbitacées|0
+glassophone|glassophones|0
+métaphore|métaphores|1
+pentécontère|pentécontères|0
+prépuce|prépuces|0
+cumulus bourgeonnant|cumulus bourgeonnants|0
+pyréolophore|pyréolophores|0
+soubassophone|soubassophones|0
+béret basque|bérets basques|0
+vocifération sportive|vociférations sportives|0
+armoire à glace|armoires à glace|1
 """
 
 
-def get_announce() -> str:
-    now = datetime.datetime.now()
-    day = now.day
-    month = now.month
+_Columns = collections.namedtuple(
+    "_Columns", ("strings", "singulars", "plurals", "genres")
+)
 
-    try:
-        day_name = DAY_NAMES[now.weekday()]
-    except KeyError:
-        LOGGER.error("Unexpected day of week!")
-        exit(1)
 
-    try:
-        data = DATA_MAP[(month, day)]
-    except KeyError:
-        LOGGER.error("Daily data not found!")
-        exit(1)
+@functools.cache
+def _columns() -> _Columns:
+    """Build the daily data columns from the packed table.
 
-    hallow = data.singular.capitalize()
-    hallow_plural = data.plural.capitalize()
+    Columns are indexed by day of year, singulars and plurals being
+    indices into a pool of distinct strings. They're built on first
+    use so that importing the module doesn't pay for it.
+    """
+    # Split all fields at once, then pick each column with a stride
+    fields = _PACKED.rstrip("\n").replace("\n", "|").split("|")
+    singulars, plurals, genres = fields[0::3], fields[1::3], fields[2::3]
 
-    if data.genre == Genre.FEMALE:
-        hallow_prefix = "Sainte"
-        hallow_all = "toutes"
-    else:
-        hallow_prefix = "Saint"
-        hallow_all = "tous"
+    # Pooled strings live as long as the module, interning them lets
+    # equal strings from elsewhere share them
+    strings = tuple(map(sys.intern, dict.fromkeys(singulars + plurals)))
+    indices = {pooled: index for index, pooled in enumerate(strings)}
+    return _Columns(
+        strings,
+        array.array("H", map(indices.__getitem__, singulars)),
+        array.array("H", map(indices.__getitem__, plurals)),
+        array.array("b", map(int, genres)),
+    )
+
+
+@functools.cache
+def _hallow(index: int) -> str:
+    """Return the capitalized form of the pooled string at index.
+
+    Memoized per index so that only strings actually announced get
+    capitalized, once per process.
+    """
+    return _columns().strings[index].capitalize()
+
+
+@functools.cache
+def _table() -> tuple[DayData, ...]:
+    """Build the daily data table from the columns."""
+    strings, singulars, plurals, genres = _columns()
+    return tuple(
+        DayData(strings[singular], strings[plural], genre)
+        for singular, plural, genre in zip(singulars, plurals, genres)
+    )
+
+
+@functools.cache
+def _table_as_dict() -> dict[tuple[int, int], DayData]:
+    table = _table()
+    return {
+        (month, day): table[offset + day - 1]
+        for month, (offset, next_offset) in enumerate(
+            zip(_MONTH_OFFSETS, _MONTH_OFFSETS[1:]), start=1
+        )
+        for day in range(1, next_offset - offset + 1)
+    }
+
+
+def __getattr__(name: str):
+    # The dict form of the table is kept available as DATA_MAP but
+    # only built on demand
+    if name == "DATA_MAP":
+        return _table_as_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def warm() -> None:
+    """Build the daily data columns ahead of lookups.
+
+    Meant for batch tools looking up many days, so that the first
+    lookup doesn't pay for the columns construction.
+    """
+    _columns()
+
+
+def _month_bounds(month: int) -> tuple[int, int]:
+    if not 1 <= month <= 12:
+        raise KeyError(month)
+
+    return _MONTH_OFFSETS[month - 1], _MONTH_OFFSETS[month]
 
-    return ANNOUNCE_TEMPLATE.format(
+
+def get_month_data(month: int) -> list[tuple[str, str, int]]:
+    """Return the singular, plural and genre of each day of the month.
+
+    Data is sliced from the columns without building DayData records.
+
+    Raise KeyError if the month doesn't exist.
+    """
+    start, end = _month_bounds(month)
+    strings, singulars, plurals, genres = _columns()
+    return [
+        (strings[singular], strings[plural], genre)
+        for singular, plural, genre in zip(
+            singulars[start:end], plurals[start:end], genres[start:end]
+        )
+    ]
+
+
+def _day_index(month: int, day: int) -> int:
+    """Return the index of the given day in the columns.
+
+    Raise KeyError if the day doesn't exist, even in a leap year.
+    """
+    offset, next_offset = _month_bounds(month)
+    if not 1 <= day <= next_offset - offset:
+        raise KeyError((month, day))
+
+    return offset + day - 1
+
+
+def get_day_data(month: int, day: int) -> DayData:
+    """Return the data of the given day.
+
+    Raise KeyError if the day doesn't exist, even in a leap year.
+    """
+    index = _day_index(month, day)
+    strings, singulars, plurals, genres = _columns()
+    return DayData(strings[singulars[index]], strings[plurals[index]], genres[index])
+
+
+# Content of lola.png, generated by tools/bake_png.py
+LOLA_PNG_BYTES = (
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00d\x00\x00\x00d\x08\x06\x00"
+    b"\x00\x00p\xe2\x95T\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\x04gAMA\x00"
+    b"\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\x00\x00\xfa"
+    b"\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<"
+    b"\x00\x00\x00\x06bKGD\x00\xfc\x00\x13\x00\x13\xeeYZ\xd4\x00\x00\x00\x09pHYs\x00"
+    b"\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe9\x0b"
+    b"\x08\x0e\x18\x124\xc7=\x0f\x00\x00 \x00IDATx\xda\xed\xbdi\xb0e\xd7u\xdf\xf7[k\xef"
+    b"}\xce\x9d\xde\xfc\xba\xfb\xf5<\x03\xe8\xc6@\x80\x04\x08\x12\x22\x05C$\xcd\xc9\xa4"
+    b"\xa5Xb\xd1\x96+V9Q%\xfa\xe0T\x12;N\xb9\x5cq\xecR\x95\xad\xa8,9\xae\xb8\xca\xd1"
+    b"\x14\xdb\x12%\xcb\xa2hQ\x22)\x82\x04\x07\x90 Eb \xa6F\x03\x0d4\xd0\x8d\x9e\xc7"
+    b"\xd7o\xbc\xd39{\xef\x95\x0f\xe7\xc1V\x94r\x19\x16\xf1\x01h\xf4\xaa\xba\x1f\xde"
+    b"\xbbu\xef\x87\xf3\xbf{\x0d\xff\xf5_k\x0bo\xb0\x9d:\xf1\xa2\xbbr\xe9\xcc\x5c\xaf7q"
+    b"8\x8e\xfa{\xc6\x83\x95\xedX\xd5S\x92\xf6\xa6\xb7\xdeA\xd2\xadZ\xe7\xe3\xae\xe8l"
+    b"\x1d\x8f\xab\xb3\xb8\xa2[\x9bv+\xb3:\x94\xc5\xbfHu|\xb8\xecv\x06\x87n=\x9cx\x1b"
+    b"\x9a\xbcQ_dfr\xfc\xc8\x0f\x0e\x5c9{\xfc\xbf\x1d\xf5\xaf\xfew]o\x93]\x15\xbc\x17Q/"
+    b" \x82\xa8G)p\x16\xc8\x160\x13\x5ch\x11M\xa8\xf1d_\xd6\xe6\xcaW\xc5\x87?,{\xddgE"
+    b"\xed\xdb\xfb\x0f\x1d>-\x22v\x03\x90\xff\x02{\xf5\xc4\xcbr\xfc\x07\xdf\xfa\x94T"
+    b"\xc3_(r\x7fO\x9b\x01S\x85\xd2F\xf1\xc1\xe1\x82'\xa9'k\x81hA\xd0\x02\xcb\x90S\xc6"
+    b"\xab#%0-\x18[AEA\x0amrQ \xc1\x8d\xc6\xa3\xd1C\x09\xf7\xf9\xfe\xb0\xfa\xdd\x1f\xfd"
+    b"\xf8_\x1c\xdc\x00\xe4?cW.\x9e.\x8f=\xfa\xf5\x9f\x1b_=\xf7\xbf\x85\x5c\xcdv\x5c"
+    b"\xa2\xa55]\xef\xe8\xf8\x80\xf7\x01\xf1\x05\x91\x02\xb4\x85:\x8fS\x07\x9a@\xc0\xa9"
+    b"\x82AL\x02RP\xd5FMA\x0e-\xf0\x8e\xec\x1d\xa3\xe4\x18\xd4\xfa`99\xfbOw\xde\xb4\xff"
+    b"\x91\xe9\xb9\xa9\xea\x06 \xff\x097\xf5\xbd\xaf\xfc\xdeG\xd6\xcf\x1d\xff\xf7\xdd"
+    b"\xba\xdf\xf2\x8c(\xbdPxG\xe1\x15\xef\xa0\xf0-T\xdb@\x1b\x1fz\xf8\xe0\xb1\x5c\x93"
+    b"\xa8\x10\xaf\xa0\x0e\x11A\x0c4\x0b\x9231\x19\xc9\x17d\xe7I.PI\xc1\x98n\xaaer\xb86"
+    b"\xcc\x0f-][\xf9\xe9\x8f\xfd\xf4G\x87\xd7# \xfa\xc3|\xf8\xdb\x0f~\xe6\xf6\xe5\x8b"
+    b"\xaf|\xd6\x0d\x96Za\xbcN\x885\x922f\x02Z \xd2&&\xc528u\xa8(u\x1d\xc9\x18\xaa\x1eP"
+    b"\xb2A\xce\x19r\x852Bt\x8c\x0b5\xdeW@\x0d\x16\xf16\x22\xe4U\xd7\xa2\xdf\xeb\x04"
+    b"\xfb\x89\x99-\xbd\x9f}\xe1\xc8\x0b\xfe\x06 \x7f\xe6t\xac_:\xf9\x1e\x1b\x5c\xeeJZ"
+    b"\xa7\xae\x86\xc4*a\xd1\x90\xda`\x94\xb0:\xa29\x83%R\x1a\x93\xd2\x00c\x8c\xb9\x84I"
+    b"B\xbd\x12\x82\xc7\x89\xa0\x08\x8a\x82x\xb2s$\xd1\x06\xa8\xbaF\xeb\x9a\x82\x0cq"
+    b"\x88c\x0c\xa9\xfaGk\xd7V~\xf6\x06 \x7f\xca\x96.\x9d\xe9N\x14\xed\xbf\x19\xaa5\xe2"
+    b"x\x89\xd1x\x9dl\x09\x15\xc3\x03.+y\x9cHU\x8d\xe4\x84Ra\x8c\xa8\xd3\x80\x9c+\x92Eb"
+    b"\xaaH\xa9F\x10\x9cxt#\xe8\xa3%hA\xa1JI\xa2 \xa39Qz\xe8\x86L\xd73\x9d\x06\xc3_~"
+    b"\xf8\xf3\xdf\xf8\xc4\xcb\xcf\xbd\x12n\x00\x02\x9c{\xe9\xe8}q\xbd\xff\xee<\x1eb"
+    b"\xf5\x1a\x22cr\x1a`6\x22\x13\x899\x13c&E\xa8\xc65\xfd\xd55\xe2hH\xae\xc6\xc4\xd1"
+    b"\x98\x143)K\x93a\x19\x18\x8e\x8cb\xaa\x18\x8a\x98\x11\x14\xbcf25\x99\x9a\x14\xd7 "
+    b"\xae\xd0uc\xa6\x8a\xdc\x9a\xea\x16\x9f[\xbax\xe9w\x1e\xff\xf6c\xef?v\xf4X\xe7m"
+    b"\x1b\xd4G\xc3\xa1>\xfa\xa5\xdf\xfb\xc5\xf53/\xfc\xed\xdc?\x85\x97eJ\x11\x0am\xd3"
+    b"\xeat\x10\xdf\xa1p\x938sXJ\x88\x19\xaaBQ\x06B\xd1\x22\x94m\xac(1_\xe0}A\x8e5\xa9"
+    b"\xaeX\xef\xaf3J\x09\xf5\x81nQ0?;A\xb6LTO%\x81\x8c\x90b\xc6\xa4 R\xe2\xda3\xd4V"
+    b"\xc4a\xb4\x98\x9c=7J\xe3\x8b\xe2\xe4k\x92\xe5\xa1\xf7\xdc\xff\xc0\xf3oE@\xfe\x5c"
+    b"\x811\xa7\xc8x4\x98\x1d\xd7\x99\x1c\x85d\x19\x17\x1c\x1e#e\xc5;%\xfbD\xae3\x22"
+    b"\x8aSG\x1dk\x5cv\xd4\xc3>!%\x5c\x82\xf5\xaa\xcf(%N\x9cx\x85Sg\xce\xd0n\x05\x5c"
+    b"\xe1)B\xa0\xe5\x03\xa3q\xe4\xf0-7\xb1o\xdf~\xda\xa5#cPx\x12P3f<\xbe\x84\xd7\x96"
+    b"\xefI\xcb\xa3\xfe\xee\xaef\xb2\xca\xc7S\xf6\xfd\xa7\xbf\xf5\xf0s\xa1\xd7}\xf2\xe2"
+    b"\xc5+\xffn\xf7\x81\x83\x8f\x1d\xb8\xf9\xe0\xe8\xba\x05$V#\xd7\xea\xb4\x16\x06\x92"
+    b"1\x09\x98v1\xa7\xa0\x1d\xb0\x16\x96\x85\x98G \x8aj\x00\xf1\x8c\xe2\x98\xe1\xfa"
+    b"\x88v\xa7E\xbf?f\xe5\xfcy^:q\x8a\xed{w\xb3ia\x86\x85m3\x14E\x81I\xe3\xc2Ze\x09IY"
+    b"\xb9\xb2\xc6\xc3\x0f~\x8b\xdbn\xbb\x95M[\xe6\xb1\xe0\xc8E\x81/ \xe7\x11\x96\x06"
+    b"\x10=*\x9en\x11\x10_\xc8(\x17\xbd\xe4[\xefI\xa9~O5\x1c\xfe\xcd\x95k+\x7f\x1f\xf8"
+    b"\xe5\xeb\xf7\x84X2\xcb)b\x09MJ\xcb\xf5p\xc9H\xd9\x13\xd5\xe3j\xc1\xe2\x08\x01\x06"
+    b"\xf5\x80\xee\xe4<\xed\xa9Y\xce\x9c>MZZBD\xc91r`\xefN\x16WWY\xef\xf7\xe9N\xb4\x91`"
+    b"\xa8\xf3\x84P\xd0\x1f\xf6)h\xd3\xf6%{\xb7\xcc\xf1\xf87\x1fd\xcb\xde\x83\x1c<|3t{"
+    b"\xb4\xa6<\xed\xb6\x11\xeb\x88\xaaa\xd5\x08\x19B\x16O\xd9\x9ab,\x91\x1c\x0b.\xbcz"
+    b"\xa2\x95+\xbb\xef\xba\x06\xc4L4\xab\xb6\x93E\xbc\x803\x87X\xc2\x9c`.`Y(\xb3!D*"
+    b"\xe0\xd9c\xc7Y\xd8\xbc\x97\x1d;\x0fq\xe1\xfc9^:\xfe\x22\xab\xeb\xabT\xc3\x11\xc1"
+    b"\xb5Y\x1d\xac1\xb7m\x92M[\xa7\x99\x9f\x9fBs\x81\xf7%\xa6\x8ea=\xa4\xeb\x13\x87n"
+    b"\xdd\xcb\x91\x17\x8e\xb3e\xcb,\x05c\xc6u\xa6\xec\x04Bh\xe1$\x02\x863!8%\xa6!\xce%"
+    b"\xae\x5c\xbb\xc2\xd5\xf3g9p\xf0P\x7fey\xc5OMO\xc5K\x97\xaf\xf8\xfe\xa0\xcf\xe2"
+    b"\xd5\x8b~\xc7\xf6\x9d\xf3u=\xba\xb0k\xd7\xfe\xf4\x96\x06\x041\xcby\x1c\x91\x8a$c*"
+    b"\xc9\x04'\x88\x0f8q\x8c+%\xf86\x8b\x97/q%\xae\xb3\xb0\xf3&\xae\x5c\x1d\xf0\xcdG"
+    b"\x1ebnz\x92\x18[<\xfe\xcc\x11\xaaq\xc5\xa7\xfe\xf2O\x90\xe2\x88c'\x9e$\xa6\x01"
+    b"\x13-E\xca\x92\xa2\xd7d`\x84\x82\xf5\x9ciO\xf4x\xc7\xddw\xa3\x80\x0dW\xb1q \xc6"
+    b"\x00E\x84\x22\xa3\x089yLRS\x13%C\xa3\xb0o\xc7>\xe2 ~\xec\xb9\xc7\x8f\xfc\xf6o\xfd"
+    b"\x9b\xdf\xbb\xf4\xb9\xdf\xff\xdc\x0eW\xa4bnnn\x10S\xfd\xd9\x85-\x0b\x7f\x08\xbc"
+    b"\xb5\x01\x11\x0c\xa8\x0d\xabQ3\x9c\x0a\x8e\x00)\x80\x16,\xaf\x0c\xf9\xe6\x93\x8f"
+    b"\xe3Z\x8e\xde\xfc\x1cO\x9e|\x96\xe7\x8f\x9f\xa2,[\x5c;z\x82\xa5\xe5k\x10\x02\xb7"
+    b"\xdfz+\xdf}\xfa\x08\xae\x1a\xb3m\xe7\x1c\xc3\xb8\xc8\x99\xe5kl\xdd\xba\x938\xaci"
+    b"\x19\xf8lX\xc8Ha\xb4\xd4Q\xaa\x12\x92'\xa7\x16\xaa-r\x8e\xc4<FE!G\xaa\xba\x86r"
+    b"\x92\xd1\xb0B\xa3\xb2yf\x9e#\xcf<?\xff\xd2\xf9\xf3\x9f\xfa\xfe3O\xb3\xff\xa6\xcd"
+    b"\xfc\xe8\x8f\xbd\xf7\x95\xe9\xe9\xdd\x7f\xe7\xbd\xf7\xbe\xff\xf3\xd7\x85\xcb\x1a"
+    b"\xf5\xd7s\x1c\x0e\xd7D\x1d\xea\x04\x07\xf8\x1c@\x02)e&6Os\xdfG\x7f\x8c\xb5q\xcd"
+    b"\xd1\xa3'Y\x1b\x14D\x99\xe6\xe9c\xa7X\xab\xd7\xb9\xfd\xeeC\xfc\xc4G?\xcc\xb6\x89"
+    b"\x09N\x1dy\x81G\xbe\xfcu\xae\x8d\x16\xb9\xe9\x8eM\x9c\xb9r\x89\xd9m\xdb\x99l\xb7q"
+    b"\xc3\x807\x8f\xa6\x0a\x9f\x22\xea+\xb2(\xd5X121\xf5\xa1\xa8\xa1\xae)B\x893e\x9c"
+    b"\x85\x5c\x05\xc4w \x0b\xa3\xc1\x80'\x1e\xfb\x13^\xb9x\x99=\xbbw\xf3\xfe\xfb\xee"
+    b"\xb6C\x07o\xfa\xa5\xfb\x1f\xf8K\x9f\xbf~\x82z\x06WL>\x97\x9c\xfbT\xd41\x0e(\x5c"
+    b"\x81j$\xb9!#Wc\xae\xa4W\xf4\xf8\xc8\xfd\x0fPU\x05_\x7f\xf4)\x0e\xde\xfeN>\xf7\xb5"
+    b"/\xf1\x91O~\x9c\xdd{\xb7q\xec\xc9\xe7\xf9\xea\xb7\x1f\xa7\xaa\xe1\xdc\xab\x97\xb0"
+    b"v\xcd\x9e]\x1dV/\x9cb\xfb\xfe[p\xed\x09J\xa6hI\x05i\x15IB&\x13\xeb1\xa2\x89*\xd5"
+    b"\x90\x0d-\x02\xe3*Q\xf8\x82\x94\x1d\x99\x08.\xa2\xad\x82\xb3\x17\xcfq\xec\xe4\x8b"
+    b"\x84\xd9\xd9\xea\xbe\x0f\xdc\xb7~\xf8\xceC\xffv8\x5c\xfe\xfd\xeb*\xa8o\xde\xb1"
+    b"\xc7\x9e\x7f\xaa\xf0\x84@t\x99\xda\x22IG F\xce\x0er\x89:\x90\xca\xb1^_\xe3\xd2"
+    b"\xa55N\xbc|\x84\xf3\xab}\x18\x0d9\xfe\xe2K\xbc\xff\xbdw\xf0\xac(\xb95\xc9\xf9\xc1"
+    b"\x05\xeaAE\xef\xf2\x98\xe9v\x1b?:\x8f\xab\x03\x87\x0f\xcf\xa1^H\xd1\xf0\xd2$\x0b9"
+    b"\x81\x17H\xb9B\x9d\xa0\xbeK4!Zf}\xbd\x8fR2\xaaV\x09m\xa1\xaej\x8e\x9d>\xc1\x8f"
+    b"\xff\xcc_{y\xdf\xc1\x9b\xbe\xb5\xef\xe0-\xbf\x17Z\xfe[\xf7\xdf\xfe\x91\xf1u\x05"
+    b"\x88\xf7!\x7f\xeb+\xbf\xf9x\xc2F\xb1\xb2V$\x11m\x0c\x22\x14E\x17K\x0dU(d\xb2\x8e"
+    b"\x99\xde\xd2\xe6\xc7~\xec\x1e\xbe\xf3\xd8\x11N\x9cy\x95/}\xfe\x8f8|\xcb>\x0e\xdet"
+    b"\x0bU_x~s\x8f'\x7f\xf0]\xc2\xe4<\x95\x9b\xe4\xb9\xe3\xaf\xb0\xbaz\x8e\x97\x8f}"
+    b"\x91C7\xdf\xc2\x81\xfd\xdb\x88\x16\x99\xe8\xceC\x05\xc1 W\x99\xa8\x05\xa3\xa11H#B"
+    b"G\x99\x9b\xdfD\x9d`\xb8n\xac\xa5\x1aB\xc1\xfd\x1f\xfe\xc8\x0fn\xbd\xe7\x9eO\xed>p"
+    b"\xe0U\x11\xc9\xd7e\xda\x0b035\xff\xc8R{\xf2\x15\xc9\xe5\xad]\x0btT\x11_`\xf4\xa0."
+    b"\xc8\x025\x15\xc9\x1c\xeb\x83\x9a\x17\x8e\x1c\xe1\xc2\xa9\xd3\xbc\xfb\xf6;x\xe1"
+    b"\xcci>\xf3/?Cw\xb2\xc3h0b\x18\x13\xabuM\x98\xe9r\xf0\xd6\x9b\xd9y\xef\x1dl\x9f"
+    b"\x9e\x84\xe1\x88\xd5\xfe\x12\xdaUF\xa2\xd46\xa0\x85'\xd7\x99\xaaJ\x8cSfhFgf\x8aM"
+    b"\x0b\xdb\xc8\xd1\xe1T(\xdacV\x07#\xfak\x03&\x8a\xe9\xad\xc3a}\x8f\x88\x9c\xb8n"
+    b"\xeb\x10\x80\xdb\xef\xfd\xe8\xda\xb9\x1f|\xef\xfb%\x93\xb7v\xd3\x88\x964dam\x11"
+    b"\x9c\x9212\x99\xf1\xa0\x86\xca\xd8\xbdm\x86\xcd\xb3\xb3\x1c?\xb9\xc8\xfe\x99\xad"
+    b"\xf8.\x14\x9dDw\xba\xe0\xf8\xe9\x97\xb9\xf5\xf0a\xf6l\xdf\xce\xd4T`nv\x9a\x85\xd9"
+    b"i\x82\x8d\xc8\xd2ci\xd4\xa7KA5\xaa\xc9)3\x10e\x84\x91D\x99\xdd\xbc@1\xd1\xa3?\x02"
+    b"\xcc\x91\xcd\xa3\xbe\xcb\xf4\x8c\xe3\x85'\x9fb\xf9\xc5\xd3[\xf6\x1c8\xf0\xe3\xe7"
+    b"\xcf\x9e\xfd\xc2\xb6\x1d;\x06\xd7- \x22\x92\x1f\xfc\xf5_\xb86\xf4\x05*MZ*\xea\xc8"
+    b"\x92Q\x1f\x111$\x1b-\xe7\x99\x9c(\x98\x9b\xda\xc2\x85\xcb\xcbl_\xb8\x9dsg\x961"
+    b"\xed3\xb6u\xb4mL\x17\x0b\xcco\xda\xc4Tw\x86\x83{\xf6\xd2\x16\xc8U\xcd\xfah\x09"
+    b"\x93\xc8\xb86\xaa\x08\x92\x1c9f\xd6\x07\x91\xb9\xb9\x1dLMo\xc2\x5c`\x9c\x8c\x84"
+    b"\x81z\xb2)\xde\x97\xa8\x14\xdc\xfd\xce\xfb\xf8\xee\xf7\xbf\xe3\x9e{\xe6\x99\x1f"
+    b"\x1f\x8dG\xbf\x00<s\xdd\x02\x020\xb1e\xc7s\x8b\x17O\x91]\x22{A%\xa3\x16)\x9ckZ"
+    b"\xb3&\x04\xe7\xf0b\xf4\xab\x11\xa1t\xd4\xe3U\x9c,\xb3\xb6v\x05\xd3L\xdbw\xb8s\xd7"
+    b"N\xa6\xba-:\xe5\x04e\x7fHJ\x99q6r\x0d\xd1\x8cD \xa6\x82Q\xbff\xa25\xc1\xd6]\xdb"
+    b"\x99\xe8\xccP\x8d2)\x19(\x04\x0f1'\xbcfb\xbdN\xa6\xc5\xe4\xcc\xdc\x85\x8f|\xfc"
+    b"\xa3\x9f\xbb\xba\xb8x\xac\xd5j\xdf{\xdd\x0325\xb7\xf9lY\xc8\xc8\x8fc\xcb%\xa5\x10"
+    b"\xc1e\x10\x15\xa2y\xc0\x91\xc516H\xbeE9Y\xd2J\xca\xd6\x85\xdd\xa4\xdcgyu\x85\xf5"
+    b"\xfe\x0ak+\x97\xa8\xd6.\xb3un\x0b\xae\x88\xa4\xec\xb0\xac\xd4\xd9\xb16\x1e3\xca#Z"
+    b"\xbd6\x9d\xe9IzS\x9b\x88R\xb2RUX\x9dq\x1a\xd0\xac\x04QJ' P\x9b1N\x15u\xffjg\xe7"
+    b"\x9eC?8|\xd7\xcd\xbf3\xbby[\xbe\xaec\x08\xc0\xd5\xb3/\xbd\x84\xa6+\x92\xab\x9d22"
+    b"\x9c\x94\x04\xe7\x19\xa2T\x04T\xdb\xc4\xe4I\xaaH\xd9\xa3UN\xe1Q\x0a\x89$\x1b2?"
+    b"\xb5\x89y\x1b\xe0l\x1bK\xd7\xcesey\x05\xe9_\xa1t\x13\xb4\xcbI\x06\xb4\xf03\xf3"
+    b"\x1c\x98\x9f\xc7\xab0\x18G\xaa,PW\xa8e0\xc1\xe1\x10\x14\x92\x902H\xad(F\xe9\x13"
+    b"\xb1\x1eN\x9e9\xfa\xd4/_<3\xbbg\xf3\xae\xfd\xff\xf8\xba\x07\xa4=3;v\xcb\x93\xc7"
+    b"\xc7\x83\xc5\x9dJ\xc6Y\xc6a\xd4\xa6D\x0a,\x95\xa0m(K\xb4,\xc9.\xe0B\x1bUC\xe9\x12"
+    b"\xe3*^=\xce\xf5\xd8\xdc\xddL\xde^#\x06.y\xbct\xc8\xa1\xd3\x14z\xb1f\xd8\x1f\xa0R"
+    b"\xe2\x11Di\x0a\xc2\xa0d\x128\xc1\xb0\xa6\x15\x0cH\xceH\x8ax\xa7b\xc9\xcd\x0c\x96"
+    b"\x07\xff\xcb\xb9x\xe6\xb6\xe7\x9f|\xf6_M\xcdN?\xb8}\xcf\xae7\xad*\xf2\x87\x92\x01"
+    b"U\xd5\xc0\x7f\xed\xb3\xff\xe7\xff\xbe\xfc\xeas\x7f\xbfHC\xe9j\x8b\x96NP\xb9\x09R"
+    b"\x98dl-\x92\xf6\x90\xa2\x8b\xf7\x8as\xc6\xe4d\x87P8\x02J\xe1\x84\x98\xc6\x90\xac)"
+    b"\xffI\xe4\x1cI9\x12\x93QG\x87\xb7\x92\xc2\x04\xb3!9U\xa8y\xb2&\x10iz1h\xf3Y\xcdx"
+    b"\x0f\x1eO\xaa\xa0Nc\xb2d$t\x88.PI&;?\x98\x98\x9e\xfa\xe7\x9bw\xee\xf9\xb5\x83w"
+    b"\x1c:\xf9f\x04\xe4\x87\x92\x01\x15E'NMn}6\x84n\xc2\x95\xe4PP\xb9\x80\xa8\xc7D@"
+    b"\x1du\xca\x0c\x06c\xfakC\xd6WVX^^\xe4\xca\xb5K\x5c\x1d\xac\xb08\x1e1\x92\x80\xf86"
+    b"\x9a\x1d!\x05\x0akQ\x86\x1ee\xb7K\xab\xf4\xb4\xd4(\xd5P\xcd\x98\x1aF\xde\x10R\x08"
+    b"N\x04\xb1F\x00\xa1\x06\xa96\xeaqM&\xa2\xce\xf0jH]\xe3\xabD\xa8#\xa1\xae;\xa3\x95"
+    b"\xa5\xbf{\xf9\xcc\xab\xbfr\xf4\x89\x1f\x1c\xbc\xee\x5c\x16\xc0p\xfd\xf2Q\xef\xddZ"
+    b"\x1a3c\xc9\xc8\x96\x09\xed\x80\x88G\xac$\xd5\x99:\x0dX\xea\xaf\xf2\xdc\x91'\x19"
+    b"\x0c\xd6\x98\x9f\x9dgv\xeb\x02\xb3\xf3s\xf4\xdam\xb6\xce\xcd1\xd7\xeb\xe0\x14\xb0"
+    b"\x04\xc9\x11\xac\xa4\xd4\x92\x9c\xfah\xca8\x0b\x88/\x1b\xf7\x94\xfb\x90*\x94\x08"
+    b"\x96\xb1l\xe4\x5c\x82\xb4\x102\xe8\xb0\xa1qp\x888\xd4\x94\xa0-\xb2d\xaaX\xb9\xd1"
+    b"\xe2\xf9\x0f^\xea/~\xfe\xe1/\xfe\xf1\xcf\xdfv\xef{?;\xbfi&]\x17.\x0b\xe0\xa9o\xfc"
+    b"\xf6\xd6\xf3\xcf\x7f\xef;\xa3\xc53\xfbZ.\xe0\x98@\x8b9j\x9d$\xbb9\xd0\xc0\xa0\xaa"
+    b"8q\xe6\x04\xc3\xd1\x1a\xbdVA\x91\x95\x9c\x8d\x95\xfe\x80\xcb+KH\x80m\x0b\xf3\xec"
+    b"\xda\xb6\xc0\x8e\xcd[\x98lOSj\x17\x87!qL\xae\x12\xc9\x0a\xc6\xa4\x863\xb3u\xa4"
+    b"\x8e\x888\x0cE\x09\x986\x80(\x89\xc4\x1a\x91\x8cY\x01\xe6h\x97\x13\x90\x94P\x80s"
+    b"\x99\xd5\xfe5r(\xe9\xbb\x89\xca&'\x7fyr\xf3\xe4?{\xef\xbd\xef\xbe|]\x00\x02\xf0"
+    b"\xc5_\xfa\xef\xbf8Z9\xff\xf1^\xe1q\xa9\x8d\x86i\xac5Cr\x93\xa0%5\x8e\xcb\xcb\xcb"
+    b"\x98B\xa7U2Q\x96\x88\x00>0\x16X\xe9/\xb3\xb4|\x85\x0b\xa7Nq\xf9\xf4\x05\xf6m\xdf"
+    b"\xc7]\x87\xde\xc1\xce];iuZ\x8cG\x918\x16\xaa<\x82b\x84\x92\xd0Z\xc8I\x1b\xf7hB"
+    b"\x16\x87\x99\xe0S\x04\x19\x12%\x93%\xe05\xd0v\x1d\x9e}\xe6\x08/\x9d8\xc6\x03\xef{"
+    b"\x0f\xf3s\xd3\xd4\xe6Xw\x1dV\x9d\xa2\x9dpbaa\xcb\xff\xb1i\xf3\xe6_\xdf}`o~K\xbb,"
+    b"\x80V{\xfed\xec\x0fM0q\xea\x9a_iZAeD\xa2\x8d\xea\x04\x13\x9d\x16\x99\x82\x10\x02"
+    b"\xd1\x0c\x17\x0cQ(\x92\xb0\xd0\x9df\xe7\xf4\x14\xb7\xef\xdcC\x1c&\xae]Y\xe6\xc9"
+    b"\xa3\xcf\xf2\xd5G\xbe\xc5]\xef\xbe\x97\xbd\xbb\x0f\xd2\xf1\x8dP;9%f\x87\x13\xc0"
+    b"\x0b\x09\xc36h\x1a\x12\xb8l8s8\x07\xceA\x00\x0a\x81^\x19 V\x0c\x86+ =T\xa1\xed2fJ"
+    b"\x1a\xa4}\xfd3\x97\xffE\xea\xd7\x9f<\xf2\xc4\xd1\xbf\xde\xee\xb4V\x0e\x1c\xdeoo"
+    b"\xd9\x13\xf2\x9d\xcf\xfe\xcb\xff\xe6\xfc\x8bO\xfe\x93\x90\xc6\x9b\xda\xa2\x84\x10"
+    b"\xc8*h\x11\xc8\xbeKm]\xc6\xe3\x82\xba\xf6$\xf1\x88w\xe0\x13\xa5+(\xf0\x94A\xa8"
+    b"\xf3\x90\xb2\x15 {\x9c\x0b\xd4i\xcch<\xe2\xf2\xb5e^z\xf1$\x93E\xc9\x9dw\xddJg\xa6"
+    b"\x8bW\x87\x8c\x13\x88\x914\x91-6\xbf\xae\xa8\x14\xd1!\xd9a!!\x1e,*\x9a\x03\x0e"
+    b"\x08!\x10\xcaH\xb4H\xc2S\x99\xa32!\xa1\xa8/\x89\xd2\xb2\x14\xca\xd5\xd9\xads\xffp"
+    b"z\xf3\xf4\xaf\xed9\xb8\xa7\xff\x96<!I\xc7\xcf\xd3v\x838\x88\xd4\x19$+\xaa%J\x01("
+    b"\x8e\x8c\xb3\x8a\x1c#9;r.\x18\xc7\xccP\xa0\xa5\x82\x8b\x11\xf5\x91\xc1(\xe1\xb5Dc"
+    b"B\xc8\x88+\xd8\xbay;\xdb\xe7w\xb1\xbax\x85\x0b\xe7.R]\x82\xe9^\x97\x99N\x8fV\xabD"
+    b"\x0b\xc5\xfb\x00\xb9\xa1m\xb2\x19I\xc1$\xe3\x04\xc4y\xcc92\x90-\x93\x87CL\x1cRx"
+    b"\x9cS\xbc\x8e0\x12\xa8R\x10Dr\x9c\x1a\x5c\xba\xf6\x8b\xab\x8bK\xbb\x9f{\xf2\xe8?"
+    b"\xba\xed\x9d\xb7.\xbf\xe5\x00\xa9b\xff\xac\xf3eGr\x81\xe4Q\xa3\xd7\xd5\x0e\xb9"
+    b"\x12\xc8\x86H\x85\xc6\x88f#\xd0&'!\xf8@\xca\x81\x14\x8d\x98\x86h\x9d@[\xe0\x12"
+    b"\xea\xc68\x83\xa0\x1d\xd4\x02D\xa3\xd5\x9d\xa3=9\xc5 \x0eX[[\xa7\x1a\xac\x10\xd4"
+    b"\x08\xc1\xd3\xea\xb5\xe8\xb4K:^\x11\xef\xc8\x08\xb5\x18E%8\x84\xb13$xJK8\x0adc"
+    b"\x82+;\x83\x22\xe0}\x81\x99\xe1Hxj\xeaX\x87\xba\x0e\x7fk\xf1\xf2\xb5=/\x1e}\xf1"
+    b"\x1f\xb7\xbb\x9d'v\xed\xd9io\x19@\xb6n\xbfyix\xe1\xea\xb1\x18\xe3&\xa7\x86\xd3"
+    b"\x8cJ\x8d\x8ao\x04\xd8\x18N\x22\xe2\x0d\xd1\x9a\x98\x87\xe4\x14\x1b\xa9\xa9x\xc49"
+    b"\x92\x19\x16\x95\x94 I&I$\xaa\xa1\x8cp@N5b\x829\xa1\xecu!\xd6`\x89QN\xac\xaf\xaf"
+    b"\xc0J\xa4\xe5\xa0\xe5\xdaHh\xe3\xda\x05\xe6\x0b\xc4*\x92\xcb\x04\x11\x9c/I\x09"
+    b"\xb2)Y\xc0RFjA\xcc\x81\x96Td2#r\x93\x04\xbb\xd1\xda\xfa'\xce\x1c\xef\x1f\xeaLv"
+    b"\x7f\x11\xf8\x7f\xde2\x80\xe4\x98\xb2\xc4\xfc\x051\xde\xaf*8\x9fQ\x17QbC\xc9c("
+    b"\x09\x91\x88\x90Iy\x88j\xbb\x09\xc6\xd9\x91\xeb\x84/\x0a\x0cPS\x9c8\xb2\x8b\x18"
+    b"\x15\x88Q\xe7\x1a\x1c\x98x\xea$x\xefq\xde\x11\xebD6\x87\xe0!'R\xce\x0cR\xa6\xae"
+    b"\xfb\xc4\xe1:\x9a3*\x99\x98\x8da\x7f\x8c\x8b\xc2\xdcL\x87\x99\x99\xcd\xb4:\xd3tZ%"
+    b"\xde\x0c\x11!\x09\x14\xce!\x06\x11\xc3\xd4\xa8\xeb\xdaI\xca7\xaf_\xee\xff\xfa\xd7"
+    b"\xff\xe0\x8f?41?\xf7\x0f\xdf\xfd\xfe{_|\xd3\x07u\x80/\xfc\xd3\xff\xf9g\xab\xb5k"
+    b"\xbf\xda\xf65\xea\x22>4\xae\xc1\xb4\x8d\xfaV\xe3\xe3s\xc2\xcc\xa8\xa3\x91pd)0-"
+    b"\xc9\x0a\x98G\xac\x8dHAm\x89Z\x13\xe2\x14D\xc8)!\xaa\x98\x06\xb2\x04\xb01XB\x10"
+    b"\xb25jy\x8b\xb9\xe1\xb9\x80\xcaj*\x1b\xa39\xe2M \x83D\xc8\x831k\xcb\x97\x89U&\xd7"
+    b"\xc6\xd2\xca2\xb5$\xb4T\x5c\x08\xb4;\x1d\xca\x22\xd0\xeau\x99\xdf\xb9\x8b\xb9\x85"
+    b"mL\xf6&\x19\x0e+\xc6\xd116^mOv?\xf0\x81\x8f}\xf0\xc4\x9b\xfa\x84\x00D\xe7\xc8\xbe"
+    b"\xf1\xcb&\x86Z\xc6k\xc2\x5cj\xa8\x0cux\xe7!\x83S#[$1\xa6\x96H\x12\xc1R\x93.\xab"
+    b"\x14\x88@J\x91\xd10\xe3|\x81\xd3\x02u\x0e\xa7\x81\x94\x15\xc9\x01p\xc4\x9c\xc9)"
+    b"\xa3^\xf0\xbe\xa0\x1e\x8fI\x02\x04GP\x8fd\xc3E\x87&\x87#SN\x15\xccOvq)\xd3v\x81"
+    b"\x1c\xc7,\xaf.\xb2\xb2\xb2\xcc\xe5\xf3\x978\xfb\xcc\xb3\x8cG\xabHpT\xa1Cw\xdb."
+    b"\xf6\x1e\xba\x8d\xcd\xbb\xf6\xb3\xfb\xa6\xdb V{R\xca\xff\x00\xf8\x997\xff\x09\xf9"
+    b"\xbf\xff\xde_\x1d\xad,~&\xa4\xa1\xb6\x9c\xa0VS\x86\x92\xec\xdb\xc4\xecq\xe2\x9a~"
+    b"\x09JNB\xcccj\x12c\x81\x88\xe044\xd9\x99y\xc4\x05p\x9edJN\x0a\xd9\x91\x13\xc4,"
+    b"\x989\x0c\xc1\xc4@\xb5Q\xc2\xa7L\x95\x93\x15\xed\xf2\xf9\xde\xf4\xe4\xd9d\xf1j"
+    b"\x7f}\xe9\xb68\x1eu]\xf6s\xa5o\xb7\x5c\xb6\x12K\xe6I\xce\x9b\xa2\xd1\xb0\x18\x09"
+    b"\x0e\xda\x1eB\xce\xd8x\xc4\xfa\xd2\x22+\xcbK\x9c:{\x81\x93\x17\xaerny\x95\xb5\xb2"
+    b"\xcb\xc2\xe1\xdb\xd9\xb1\x7f7\xb7\xdfu\xd7\xc5\x9d{v\xdd\xf7\xc0\x07\x1f8\xf9\xa6"
+    b">!\xa1\xc4FRc\x16\x91\xbcA\x83[\x03\x00N!e@03\xc8\xe0\x09\xa8z\xd4\xe7\xa6_\x22"
+    b"\x0eI\xcdCB2FDU\x10\xe7\x90,\xa89DJb6\xa2d\xc6)\x92\xb20\x1aE\x06U\xeew\xa7g\x7fg"
+    b"\xd7\xc1\xfd\xff|jn\xe6X\x7f\xb0\x9a\xcf\x9d\xacY\x1e\x0e\xf8\x0b\x9f\xfc\xf1\xf6"
+    b"\xe2\x85K\xb7\x9f;qb\x7f\xd1nE\x15\xdb\x5c\x8d\xe3\xf6\xda\xd8?\x1e\x0com\x17\xa1"
+    b"mb\xc1r\x0c%tz\x9b6w\xe7%\xe9\xfew%\xea\x98\x19\xc4\x8au\x09\xa4\xde\x14KuM\xa7"
+    b"\xe5\xcb^\xaf\xc3\x9b\xdeee\xa8j0\x15A\xb2P\x8aC\x92`\x0e\xf0MKW\xcd\x81\x19\xa2"
+    b"\x86\xd9\x181\x08\xd9\xa1Q\xf1\x1ap\x02\xa6\x89$\x91\xe4\x1b\xd2\xb0\x1a\x8f\x9b_"
+    b"\xb3(\x12Z M\xb5\xae\xa1 \xc5\x922t\x8fL\xf5f\xff\x87]\x07oz\xf4\xae\x1f}\xdf\xff"
+    b"\x7f2\xf7\xef\xfd\xfc\x00xt\xe3\xf5\xff13\xd3\x8b\xe7\xce\xcf\xaa\xc8x8\xecw\x17"
+    b"\xcf\x9d_\xe8_8\xbb\xcdOt\xb6\xe4\xd10\x16\xc8L\xaf\xd3\xde2k\xda\xa2\xe8\x0c\xf6"
+    b"u'\xab+W.=|\xcf{\xee=\xf9\xa6\x07$%\xf7\xa8Q\xf4\xd1<\x99-\x13\x13\x88\x19Yk\x0c"
+    b"\x87\xc37\xee&ep\x06\x18JFR\xc6eA\xaa1\xea\x1c\xa6B\xd6L\xae\x13)%\x88\x11\xb2 A"
+    b"\x89\x96INI\x14\x0c\xab@gz\xcbS\xed\xa2\xfc\xc8\xc7\xfe\xda_\xffs\x11\x83\x1b:"
+    b"\xad\xab\x1b\x7f\xae\x01\x17\x81\xa7\xdf\xb2\xfd\x90\xd7\xac\xbf\xb6R\x8c\x96\xaf"
+    b"\x9c/CQ'\x83\x1a\xa8\x9c\x92\xd4\x91\xc50j2\x15\xd9\x22\x99D\xb2\xc8Xa\xe4\x8d"
+    b"\xca\x8f\xc8~\x1di\x0d\xb1\xb2\xa2.\x12\xb56\xb5\x82\xb8@hw\x08\xed6\x09O\xd66"
+    b"\xb5\x95\xf4G-Lf\x9e\xc6Z\x7fn0\xae\xcb\x16\xeek\xd6\xe9M\xd6;\x0f\xdf'\x17\x8e?"
+    b"\xd6\x14\x5c\x12H\xe6\x10QD\x12H\x0d& \x0e\x04DRC\x07\xe6DU\x8fp\xd4\x94\xbe\xd8"
+    b"\x18\x8bv \x01S\x05\xb5\x86\xf2\xc0\xc8N\xa9\xcd\xd3\xaf\xa0=\xb5ii~\xc7\xee\xff"
+    b"\xf1\xfd\x1f\xff\xd0u\x05\xc6\x1bvBD\xc4\x96O\x1fA\x0dJi\x16\x04d\x8cD\xc2$\xa3"
+    b"\x92\x08\xdeP\xadQ\xadq\x9a\x09)#U\xd3\x8c\x8a\xb5\xa7\xbf\x9e\x18\xadEl\x90\xd1"
+    b"\xb1\xa1\xd1\xa1\x94d<c\x84\x81\x09\xab9\x91\xbb\xbd\xd4\x9b\x9b\xfe\xe4\xc4\xd4"
+    b"\xd4\xb7\xb9\x0e\xed\x0d\x8b!\x16\x03T#\x88\x86\xfa\x88\x0b\x0a\x99\x06$-ht\x09u3"
+    b"\x02\x9d\x14\xa1\xd9\x0ed\x08F\x81\xe5D\x9d!Uc\xa4\xced\x89\xa4\xa0\xa4\xa0D\x15"
+    b"\xfa\x96Y\xc7\xe8\x94\xfe\xe7>\xf4\x93?\xf9\x1d\xaeS{\xe3\x82\xfap\x84\xa4\xe6"
+    b"\xf1\x22\x19u\x1b\x14Grht\x08\x86\x13k\xe6\x0b\x93\x926\x86;\xd5\x0c\xb3&\x80W"
+    b"\xb1\xa2\x8e5)\x83Y \x05\x0f\xed\x16\xd9\x97\x8c\xb4\xa033{\xe5\xe6[\xdf\xf1 \xd7"
+    b"\xb1\xbd\x81\xfbB*Dk\x9cdD\x8c\x9c\x1b\x8eH\xc5A\x126\x96\xfe\x00B6\xd9x\xe8`\xc9"
+    b"\xc02\xa2\x09\xd1\x84\xf9\xd4\x10\x8c\x06I\x0crh\xe2\x0f\x81jP=\xfd\x9e\xf7>p\xe6"
+    b"z\x06D\xdf\xa8/\xea\xf4\xa6\x0f\xe4\x5c\x95\xc8\x10\xa5F\x92\x11\xeb\xdc\xa4\xae^"
+    b"@\xa5\x09\xd0\x99\x0d\x12\xd1A\x0eX.\x88\x16\xa8\xc5S\xab`\xaa\x88\x13\xf0J\xb6"
+    b"\xe6;\xea\x0aR\xf4LM/T\x5c\xe7\xf6\xc6\x15\x86\xb9z\x1f9\xf5\x10\xc3\x0c\x5c\x08"
+    b"\xb8\xdc\xcc\xa8\xa3\x81:%\xc8M\x96\xa5\xa2\x98\xb8\xa6j\x97\xa6zO\xb9\xa6JB\x9d"
+    b"\x8c\x94\x9a\x96l\x92\x02\xe7J\x90\x123O\xb7;\xf1\x9b7\x00y\x9d6\xce\x95\xcb\x9a1"
+    b"QR2\x82s\xcd\xd2\x00\x1c\x89\x80\xa9\x07\x12\x922\x82`9\x91\xd3\x86\xe0-g\xb2\x81"
+    b"\xba\x80sJ\xae\x9b\xec\x0bi\x16\xd1\x18\x01\xef\xdb\xc4Q\xbc|\xbd\x03\xf2\x86\xb9"
+    b"\xac\xb1\xdat\xed@\x8b\x80\x88Bn\xe2H\xd3\x09Q\xd0\x80\xb8\x808\x87\x0ax\x0f\xc1"
+    b"\x19N2J\xc2I\xc6{i\xda\xae\xc2F\x0d\xa3\xe4\x8d\x98\xe3\x8b\xe2\xd5\xfd\xb7\xdcr"
+    b"\xf4\xc6\x09y\xbdY\x96\xf8\x03\xa6%)\xd7\x14\xaax\x15\xb2\x00\xd2\xa8KD\x9a\xe0"
+    b"\x0d\x8d:\xbe\xe9\x9b\xd7\x90\x13\xe4\x88\xd3\x0c)\x229\xa2\x088\x87\xa8'\x8a ^iu"
+    b"\xdb\xaf\xdcv\xcf]Wn\x00\xf2\xfa\x93\xac\x9b\x5c\xf2\x0d\xdb+\x86\xe5\x84\xb9LN5"
+    b"\xa8 N\x1aP6\xaaoK4\xf2hQ\xbc:\xea\x9c\xb0\x9c1\xcb\xcdf\x08UD\x95\xacB\x14\xd2"
+    b"\xec\xe6\xcdO\xf06\xb07\x0c\x10_\xcb\x82\x8d\xc0\x07E\x5c\xda\xd0\xe1&T\xa5i\xe5"
+    b"\x9a\x80d\x12`\xd6t\xf6\xd4\x07$\x1b\xa9\x1ac\x19\x04\x87\x13\x01\xd3&=\xde\x00LU"
+    b"]\xac\xab\xe1\xdb\x01\x907$\x86\x1c\xfd\x93?\x9a\xca\xa9.R\x8a\x98i\xf3@SB\x92"
+    b"\xa2(N\x15\x95\xff8\xcba@-F-\x89(5Q\xaa\xa6\xe1\x84\xe2(\xf0Zn\x9c\x90\x8ci\x0d"
+    b"\x1a\xa9\xab\xc1\x95\x1b\x80\xbc\x1e\xca\xc4L\xb7\xed\xbb\xbdo\x1a\xf1\xa5`\x0a"
+    b"\xe2\xb4i\xb9\xca\xc6\xc6Q\x05QP\x15\x9c(N\x14\xf5\x0a\xa1\xa97\x9c\xf7\xa8\xfaf"
+    b"\xba\xc3\x5c\x03\xa8\xbdVH*\x88_\x16q\x0f\xdf\x00\xe4\xf5\x11\x8byfaoT\xc0{\x87"
+    b"\xa8\x80+@\x0b\x9c6\x15x\x96D\x92D2CL\xd1\x14\xc89\x11SML\x99\x94\x043\xbf!tPD"
+    b"\x9a\xefr\x12P)\x11\xca\xef~\xf8'>\xf5\xea\x0d@^\xa7}\xf5W\xff\xeea\xb1\xd1\xac"
+    b"\xda\xb8YFCh\xe4\x9cDLj\xb2\xc4F{\x8b \xd9\xe3b\xc0%\x8ffi^\xe6qZ \x22\xd8k\xed["
+    b"\x01\xe7<\xc1\xb7)\xcaI\xd7\xea\xb4\x07o\x07@\xde\x90\xa0>\x1c_\xbb\xdb\xf2\xca"
+    b"\xb4\x9a\xe0\xa4\x85\xc4\x02\xd5\x024`4k\xfe\x9aj>m\xa4\xb6\x8d\xfe\xaa\xb0\x12DH"
+    b".\x11cB\x9dl,\xc4\x14\xb251%&\xcb\xddn\xfb!\xde&\xf6\x86\x00\x22\xf8\xdd\x163\xea"
+    b"<^B\xa3X\xcc\x82\xfa\x16\xce\x83\xe5\x88\x8a!\x02&\x91\xac\x06\xd9\xa1\x99F(m\x09"
+    b"\xe72f\xd6\xa8\xd1\xb3\x90\xb3\xa3\x8aFr\x96S}\xfdW\xe8o, 1\x9c+\xfc$\xc1)f\x8e("
+    b"\xcd\xec\xb89\xc3\xa38\xd3f\xa1r\x16\xb2(\xd99\xccy\xb2dR\x8cd\xa9\x1a0P,5\x92"
+    b"\x9fZ\xb4\x91\x99jp\xde9\x7f\x03\x90\xff\x02\x8b\xb9\xb8\x87J\xa8\x83\x11\xbc\x82"
+    b"\xcb\x88Odmhtg@j61\x08\x05\x22\x81l5I2xC]\xb3=N^\x1b\xc0IB\xca\x8aI\xb3?n\xcf\xcd"
+    b"\x07\x9f}\xbb\x00\xf2\x86\xa4\xbd&\xf9\x9d\xea=)\x099m\x14v\x0aI\xad\xe9\x87\x9b@"
+    b"n\x04o\x96u\xa3V\xc9 \x89\xacFVC\x5c\x03\x809\x87\x16\x05\xea\x03\xce;Tr=1=y\xf1"
+    b"\x06 \xaf\xd3\x1e\xfb\xeaoj\xb6A\xdb\xfb\x84s\x8a\xe5\x0d5y6\x84\xb4QL\x04\xa0"
+    b"\x8dh\x8bdP\xa7\x0a\xd3\x8cI&\xe5D\x8c\xcd\x02\x7f3p\xea\x09>l\xa4\xd0\xa0\xaa"
+    b"\xe7:\xbd\xc9\xc1\x0d@^\xa7-^81m\x16{P\xe1\xd4\x08\xc1\xa1\xb2\xd1\xae\xcd\x86X3"
+    b"\xce/4\x0b\x97E\x0d\xe7S\x93\xd6\x8a\xe2PT\x9a\xf7U\xb4i#b\xa8k\x86nB\xa7\xac_x"
+    b"\xea\xd1\x95\x1b1\xe4uZ]W\x07R\x8a[b\x1cS\xa8\x22\xb4a\xa3\xe6\xf0\x84\x0d\x0e+"
+    b"\x92\xa9_+$\x11\x11\x5c2\x94f\x94 Y\x93\xabE\x1a\x11v4#\xaa\x12\xd535;wa\xcb\xae"
+    b"\xdd\xdc\x00\xe4\xf5\xc6\x10\xd2\xa7\x15\xebxm\xa8\x92\x9c\x05\xa2\xc39E\xd5\x81%"
+    b"r\xae\x08\xaei\xcd6k\xfa\xac)\x1cSn\x18^6h\x15m\x94\x8bb \xce\x11Q\x93P<\xf7\x8ew"
+    b"\xff\x88\xdd\x00\xe4uZ\x1a\x8f\xf7\x8b\x09N\x02\x22\x0e\xb2\xfe\x07\x1a\x04mN\x84"
+    b"%\x1a\xe1[\xd6\xff\x10+\xb2\xd5\xe0\xac\xb9\x0d!5\xb7\xea\xa0\x8a\xd3\x80\x17\x87"
+    b"\xd3\x02\xb2cuy\xfdU\xdeF\xf6C\xc5\x90\x87\xff\xe0\xff\xda\xe9C\xfbng\x011\xdf$N"
+    b"\x0e\x9c\x176\xe4\xef\xa0\x8a\xb8\x82d\x81h\x05\xc9\x0a\xb29\xa2djMdg\x88\xf7\x0d"
+    b"\x15/\x0d\xb1(\x1bSQbE\x9c\x9d]\xf8\xfe\xdb\x09\x90\x1f\xea\x84\xac-.\xf9z0n{m"
+    b"\xee\xf70Z\xcd&9odif\x02_\xebm\x98\x82Hn\x14\xa54a\xc6r\xd3_WuD\x8c\xb81\xb2\x9f"
+    b"\x15\xb2$\x9c\x16y\xdb\x8emWo\x9c\x90\xd7a\xc7\x9f{\x22\xb4\xa76o\xcf\x16\xa7\x9a"
+    b"y\x8e\x8d\x8bX\xc8\x90kdc\xbb\xcfk\xf2\xc5,\x91\x9a!\x91!Y\x078\xcd\x94\xdal\x05"
+    b"\x22\xa7f\xe5\x927\x92k\xea\x12u\x9eN\xb7w\xf4\xc2\xa9S\xe7o\x00\xf2:\xec\xe0mw"
+    b"\xd7\xfd\x95K\xb7\xc78\x22\xe7H\xce\x8a\xe1@\x0c\xb5\x84{\xed\x14DC\x92\xa1\x06JF"
+    b"\x89\xa8D\x94F\x9b%\xa6\xe4\xd8\xc8K\xcd \x8bQo\xe8\xb1T\xc3\x0b;\xf6\xecK7\x5c"
+    b"\xd6\xeb\xb4\x02\x0eU\xa9\x22`\x08\xae\x19\xe4t\x02\x0a\xce9\xd4h\x0a\xc4\x0c*"
+    b"\xcdC\xcf\xd9\xb0\xac$i\xae8\xca\xd04\xb2\x9a\xc5\x1c\x98z\xb2xr\x0eT\xe3jyey\xd5"
+    b"n\x00\xf2\x9f\xb1\x87\xbe\xfcY?\xb8vj\xd2\xf7\x97\x0e\x97\xd9p\x89\xe6~BU\x92J"
+    b"\xd3O\x97\xbcQY\x80g\xa3\xe0\xdbhP\xe5,T\x96\x1au\xfc\xc6\xff\x15\x9ae\xfefd\x11"
+    b"\xea\x9c\xd1\xe0\xb6\xf7\xd7\xd7\x947\xd1\xed\x05oJ\x97\xb5yn>\x17\xa1\xa8S\x1a'"
+    b"\xb1\x8c\xc7\x91c\xb3\xbb*g#\xe5f\x8a6\x111\xad\xc9:&IE\xd2H\xd4L\xd4\xe6~\x05#"
+    b"\x91\xa5y\xdf\xb4F6\xee\x01\xc1\x84d\x82/\x8b\xb2;9!7N\xc8\x7f\xc2\xbe\xf8\x95"
+    b"\x07\xb7\x0d\xfa\xab\x1f\xfb\x83/\xff\xf1\xdf9\xf5\xd2\x93\xe1\xf6\x9dS\x9b7\x07a"
+    b"Z\x0a\xbc\xcf\xcd\xf5xQ\x9baM\xdf\x5ca\xa1b\x90k\xcc\x12f\x8edB2m(\x15\x11\x90F"
+    b"\x9d\x92\xcc\x9al\x8c\xd0HG\xf1dd\xb4\xf7\x96\x9bJ \xde\x00\xe4\xcf\xd8\x8b\xcf"
+    b"\xbf\x1c\x9e~\xee\xd9\x9f\x7f\xe8\x1b\x0f\xfd\xd7O\xfd\xe0\xdb>\x0f\xaf\xb1r&\xf0"
+    b"\xc0;\xef\x22t<3e\xb1\xb1~O\x1b\x05|\xceh*\x1ar1[S\x10\xaan\x00\x92\x01C,#\x96P"
+    b"\xf5\xd4\xb9\x91\xfefi\xe4?&\x8e\x18\xd9}\xe5\xd2\xd5C\xc0\x137\x00\xf9\xb3\x80"
+    b"\x1c{\xa55X\xa9n=u\xe2\xaa\x9f\x9c\xd9K\x98\xdf\x022\xe0\xb7\xbf\xfc=\xdey\xf3"
+    b"\x0ef\xdb\xd3l\x9am\xb1k\xeb\x1eB\xa8\xb0<\xa6\x90\x09Z:\x85%\xc8\x08Q#icobLk(M"
+    b"\xc07<\xd9\x05\xc6\xa9\xa2\x8a}*\x831\x91rrj\xcf\xca\xea\xb5]O=y\xe4\xc8]\xef\xbc"
+    b"}|\x03\x90?e\xc3q\xec\xf4&\xb7L\xee\xdf\x7f/O\xbdp\x94\x99m\x05\xaf.\x1e\xe3\xe6"
+    b"\x0f~\x80\xcb\xeb\x97x\xfc\xa5\x93\xbc+\x1c\xe4\xe5\xab\xc7Y]}\x99;o\xdb\xc3t\x98"
+    b"%\xa4>e(p>\x93\xa4\x22\x9a#\x14%1\xf5\xb1\xe4\xb1Z\x9a\xcb(%\x90\x5c\xa0v\xffq"
+    b"\xdb\xe8\x83\x0f~y\xe6\xf0\x95{\xfe\xd7\xf7\xdew\xff\xee+W\x16\x7fe\xd3\xa6\xb9"
+    b"\xc1\x0d@^\x8b\xfe\xae\xec\x8d\xaa\xfa\x1b\xabkK\x87.\x5c\xba\xccU+\xa1;\xcd\xf94"
+    b"\xc5\xc5\xd5E\xba;\x0f3\xd8~\x90c\x8f?\xc9\xa6\xd9M\x1c][\xa6\xa7K\xa4\xb5\xc8Bo"
+    b"\x9e\xdd\xdb\xf7\xb1r\xb5\xc2\x87\x16y\xb0\x82\xf8\x88E\xc3e\xc8q\x84\xba.\xc3"
+    b"\xa4\xe4`D\xa9\x18%\xc7j5%\xbf\xfb\xf9\x87\xde\xbd4\xaan\x1e\xb88\xf5\xbb\xdf\xfc"
+    b"\xca?\xf9\xf4\x03\x1f\x1e\xbf\xed\x01\xf9\xce\xc3G\xfc\xd5\xab\xab\x1f|\xe5\xdc"
+    b"\xd1\x8f\xbd\xf8\xe2\x13\xac,\x9e$e\xc7m\xef\xb8\x85\xe9v\x8b4\xb5\x8d\xaa\xf6"
+    b"\xac\xda\x1cW\xf2\x0c\xfd\xf55\x06\xed\x84\x93\xab\x90\xfa\x1c;\xb7\xce_\xd8q+"
+    b"\xa7\xaeE4\x0a\xed\x960\xd1s,]\xb9\x026bz\x9a\xf2\xeeZ\x00\x00\x07\x0cIDAT\xaaM"
+    b"\x7fm\xc4 \xce@\xc7s\xec\xd4K\x14\xd3\x0b\xe4\xde\x16\xbcd\xbe\xfe\xe4cS\x07\xee"
+    b"\xbb\xf3g\xe7\xa7&\xbe\x0e<\xf2\xb6\x07\xe4\xd4\xc9K\xbb]\xe9\xfe\xea\xb9\x0bg"
+    b"\xf7\xcem\x9ed\xa5\xdfb\xc4\x22\xb7m\xf7\xccMT\x14\xd3\xdb@'\xa1\xe8\xb2p\xef\xbb"
+    b"H\xbe\xa2f\xc0\xd9\xb3'\xf0S0\xea\x1a\xdf\xbdR\xb3\x96'\x19\xaf\xf6\xd9?\xb1\x99"
+    b"\x97.]fy\xb5\x85H\xa4=\xec3\xd1\xde\xc2\xd5\x95\xc8\xee\x85\xad\xf4{#\x98]\xe0"
+    b"\xca\xf2\x12\x83j\x9d\xc3\xfb\xf6\xd2\xeat\xc8i\xb8\xeb\x86\xcb\x02Z3Rd\xea\xce0"
+    b"\x0dX\x1f\xf5\x19\x8eVpi\x09w\xed\x14\xbb'\x0bz\x19\xd2x\x9d\xcc$;\xe6&\xe8\xe7@"
+    b"\xce\x057\xed?\x84\x05\xa1\x9f3\xcb#\xa3jO1\x9a\x19#Tt\xe7vC\x17\xd6\x06\x8bH\xab"
+    b"\xe6\xd4\xe5\xab\xb8\xa2\xc5\x99\xa5E\xce\xac\xac\xb3\xa9\xb5N\x7f\xf5\x22w\xdcz"
+    b"\x80\x0f}\xf4#\xe3\x94\xf3\xdf\xee\xb6\xfd\xe7n\x00\x02T\xb66}\xee\xc2\x85{\x8e"
+    b"\xbe\xf8,\xb9\xc8\xdc\xfd\xde\xbbX=\xfd<\xf5\x95%\xdc\xec2\xbdPQ\x16\x01\x09c\xd6"
+    b"\xeae\xe6\xcb\x1e\x0e\x18\x0c\x06\xd4\x83\x11\x95\x19C\x1c\xa3\x0cL\x95\x8cRE6"
+    b"\xa5n\xb7\x89s;\xa8\xfd\x98z\xf3\x1c\x14=FV\xb2{\xc7vn\xbb\xe5\x00\xf3s\x136\xbdy"
+    b"\xeaLM\xfe\x95\xa5\xab\x97\x1f\xf9\xe8\x03\x7f\xa5\xbe\x01\x0807;\xb3\xff\xe9g"
+    b"\x9f\xb5\x0bKWd\xef\xcd;9s\xfe4\x0f\x1c>\xc4\xd6\xe08\xf9\xdc3\xf8\x1d\xdb\xd8"
+    b"\xba}\x01lD\xb7\x0c\xb8\x90\xf1D\xdam\xc3U\x1dDJ\xd6F#\x06i\x85\x983\x95\xcb\x8c"
+    b"\xe2\x90T\x0b\x12z\x0ck#:!\x8e\xc6H9\x07\xe5$[|qv\xaal\xfd\xeaL(\xfem\x7f<|\xe5S"
+    b"\x7f\xe9\xaf\xbc-8\xad\xd7\x05\xc8\xda\xca\xda\x1dK\x8bKi\xd3\xec\xbc\xbfv\xe1"
+    b"\x22\xfbfz\xfc\xc8{n\xe7\xa6\xb9i\xbe2\xbc\xc6\xcb\x97.Q\xccN\xd0\xf5\x8a\xcb\x05"
+    b"\x05\x05e\x10(k\x9c\xf38\xdfFZ\x0174b\x1a\x91\x15\xc6YHE\x8d\xbaU*k\xd6q8\x99n"
+    b"\x96\xf0#L\xe1N\xee\x9d\xdd\xfcKw\xbc\xeb\xb6\xb7\x8d\xe2\xe4usY\xab+\xfd/\x898"
+    b"\xdf\x0am\xae]\xb8\xc6\xfc\xf44\xdbv\xef\xe4\x1b\xcf>\xc5hz\x9a\xe5\xd0\xe3\xe9"
+    b"\x97.0\x1c\x08\x980\xec\xaf\x91\x86\xe3fA\xbe\xd5\xf4\xabUF6@[J\xbb\xdb\xa6\x1dZ"
+    b"\xb4\x8b\x1e\x9dV\x8fvp\xb4\x83\xd2k\xb5)B \x94\x82+\x8c\xb2\x1d:\x13S]\xc7\xdb"
+    b"\xcc^_\x1d\xe2C5\xb3i3\xc5\xf9\xb3t:\xb3|\xed\x91\xa3\xd4\xa9\xe6\xa6;\x0e\xf1"
+    b"\xe2\xd9S<q\xf22\xef\xde\xbb\x8d\x13\xd7V\xa9\xce\x9d\xe3\x1d7\xed\xa6\x1eV\x98s"
+    b"\xc4\x1c\x19\xe5\x11Q\x02.\x14\x1bt;xQTB\xd3\x0b1O\xaa\xbb\x88\xeb\x92\xd5CH,._"
+    b"\xbe\xf3\xd4\xe9\xf6\x87\x80\x7f\x7f\x03\x90?c\xbd\xa9\xeex~\xcb\x5c\x5c]\x1f\xf8"
+    b"\xdb\xdf\xf5#\xbc\xf2\xc2s|\xfe\x91W8\xb8\x1c8we\x91m;\x0e\xe3\xf7,\xf0\xd0S\x8f"
+    b"\x93\xaaEZ\xb3\x9e]E\xc9d\xeaP\xb4J\xcaP\xe2\xb2c}\xd4GK\x01\xa9($7\xcd++\x10+0"
+    b"\x0a\xc6U\x84\x8e0\xaaVy\xf0\x8f\xbe\xe3\xdew\xff\x87>\xfe\x85/|\xf9\xf9O|\xe2"
+    b"\xa3\xc7n\xb8\xac?e\xc1\xcb\xa5M\xf3\xb3_\xfb\xf0\x87>\xcc\x0b\xc7^aj\xdbn\xfe"
+    b"\xf2\xa7~\x86\x95\xab\x91\xcb\xa7V\xd84\xb7\x9b\xa5\xba\xe4l\xae\x89[\x17\xf8\xfa"
+    b"+\xe7\xb981\xcd\x9f\x9c|\x85\x13K\xd7X\x5cY\xa2`\xc8t\xcbhy#h\x81Y\x89h\x87Q\x14j"
+    b"\x0f\xa9L\xd0M\xd4\xc5\x88\xceD\xc0F}\x9e}\xf2\x99\xbf\xd1)\xbb\x8f~\xe7\x91\xef"
+    b"\xffO\x97/_}[\xd0\xf0\xaf\xcbG\xff\xeeo\xfd\xd6\xdaO}\xfa\xd3\xfb&\xbb\xd3\xf7/"
+    b"\xaf\x8ed\xd3\x8e\xad<\xfb\xe4\xe3t5\xb1{a\x82\x0bg_A\x89l\xdf\xbc\x9b\x96n\xe6"
+    b"\xe6\xdb\xeee=gVb\x9f\x8f}\xe2\x93\xec\xd9\xb9\x97<\x18p\xf1\xf29j\x11\x5ck\x12"
+    b"\xc9-\xdae\x87\xdeD\x9b\xb2\xeb\xe8\xf6\x1cN2\x85\xf78s\x9cx\xe9\x0c\xe3\x11\x1a"
+    b"\xcaVy\xee\xe2\xc5\xf3\xbe,\x1e\xfd\xd7\xff\xea7\xd6o\x9c\x90\x0d\x8b\x83\xf1gB"
+    b"\xb6g\xef~\xc7\xad\xf4\xaf]\xc6I\xe2\xf0\x1d\x87\x99\x9c,\xa9V\xcfR\x0c\xaf2+\xc2"
+    b"m\xdbv\xb1w\xd3f\xce\x9c8\xc1\xe1;o\xa5\xb7c+_~\xea8_\xf8\xc1\x05N\x8d\xa6\xf8"
+    b"\xf2\x913\xfc\xfe\xe3G\xf8\xedo~\x9d\x17\x16\xcf\xf1\xcc\xe9\x17\xf9\xd6\xf7\x1e"
+    b"\xe6\xe9'\x9f\xe6\xfc\xf9a\xaeF\x9d\x95\xf3\xe7\xd7h\xf5v\x92d\x9a\xcf\xfc\xbb/p"
+    b"\xfc\xd5S\x9f^]_\xff\x07\x8f=\xf6Dq#\x86l\xd8\xdf\xf8\xe9O\x9f\xfc\xd7\xbf\xf6"
+    b"\x1b/\xbb\xe1\xfa\x9d\xb7\xef\xd9\xce\xa1\xfd\xbby\xe2\x89\xc7y\xf9\xc4I\xee\x7f"
+    b"\xe0\x01f\xa6\x1c\xc7\x9f{\x9e\xb6\xac\xb1z5\xb3\xa3\x0dG\x1e{\x82\xf1P\xc8\xe5$"
+    b"\xdd\x9b\xf7\xf1\xca\xc5UNH\x87$\xeb\xb4\xb7t\xf9\xa3\x13\xa7Iq\x99\xb4\xb6\xc2=3"
+    b"\xbb\xf9\xd8{\xeeK\xa7\xae.\x9dz\xfe\xa5\x97\xee\xf0;\xf7p\xed\xd5Etn+\xcb\xd1"
+    b"\xb7\xd7\xcd\xa5\xcbK\xd7\xbf\xdbz\xddi\xe5\x1f\xfe\xd6?\x0b2^\xff\x99\xf1\xd2"
+    b"\xd5\x03]\xef\xe9\x16]\xd6\xd7*\x8a\xde<\xd3\x0b;9q\xf64'/\x9d\xe6\xee{\xee\xe0"
+    b"\xe2\xb9\xd3\xbc\xf8\xc4\xd3\xe8X9}z\x91\xe5Ue\x94\xda\xe4\xa2\xc7\xd4\xfc\x02"
+    b"\xea\x1c\xf3\xbb\xf61*&\xb9\xd0\x1f\xe3\xa7&\x99\x5c\xd8Bl\x95n\x90\xab-/\x9c="
+    b"\xc9R\x86\xc5Ad\xeb\xee\x1d\xdc\xff\xc1\x0f\x0e\xda\xed\xe2\xeb?\xf9\xe1\x0f|\xed"
+    b"\xc6\x09\x01>\xff\xd9\xdf\x10\xeb\x9f\xdf\xdf\xd1\xf1\x9d[\xdb51\xf7\x89u\xe0\xde"
+    b"[\x0e\xb2\xe6\xdb\xbcx\xfa,\xaf^H\xec\xba\xf9G\x18\xb7\xb6p\xec\xe2\xf7\xb9\xed"
+    b"\x8e\xf7\xb1k\xa2\xc3\x83\xdf\xfc&\x83c\xa7\xe9M\x1c\xa1=\xb9\x89\xad{\xf6\xd1"
+    b"\xf5\x82\x5c\x1a\xb2\xa5\xec\xd2\x9a\xda\xc9\xfc&%\x0e\xd6\xc9\xd5\x98V\xd9f\xb8"
+    b"\xba\xc6(\x09\x17N^\xe3\xd0\xfe\x9d\xccN\x97/U\x83\xa5_\xba\x91\xf6n\x98\xe5Z\x1c"
+    b"y{\x1a\xaf\xb6\x0b\x1b\xd2\x92\x80x\xa1\x15\x13e\x9d\xf13[\xd8\xfd\xe1\x9f\x22"
+    b"\x97\x9e\xc7\x1f{\x94A\xdc\x86\xcc\x1d\xe4\xf4\xcai\xc2\xc2,\x1f\x7f\xf7=\xcc\xb5"
+    b"z|\xf5K_\xe3\xdc3\x170\x13ZE\x9b\x9a\x12\xdf\x15\xea35\x92j\x1ez\xf29V\xab\xc4"
+    b"\x99\x8b\x03V\x87=\xf6\xdfv'\xe7.\x9cfy\xe9\xfc\xd2\xdf\xfa\xa9\x9fZ\xbd\x01\x08"
+    b"\xf0\xbd\xef}\xb3}\xfe\xd5\xe3\xff\x95w\xdd\x9f3\xbb\xd2iw2\x8e\x01\xaa\x9e\x9ezZ"
+    b"\x95\xd0):\xac\x88\xa7\xc2s\xcf\xe1;9|\xfb\x9d\x0c\xe2\x1a\x8f^:\xcd\xfa\xf4\x0c"
+    b"\xeb\x93m\xae\x5c8K{a\x8a-\xe56r%\xcc\xb5\x8d3\xe7.Rx\xa1-p\xe1\xca\x12\x14]rR"
+    b"\xb6n;\xc0\xf6\xeeN\x96\xc7\x89\x03\x0b;({S\x93f&\x22r\xdd\xf3Y\xff/K\xa2p\x97N"
+    b"\x96ic\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+def get_announce() -> tuple[str, str]:
+    """Return the text and summary lines of today's announce."""
+    now = time.localtime()
+    day = now.tm_mday
+    month = now.tm_mon
+    day_name = DAY_NAMES[now.tm_wday]
+
+    # Can't fail since the table has an entry for every day of a leap
+    # year
+    index = _day_index(month, day)
+
+    _, singulars, plurals, genres = _columns()
+    hallow = _hallow(singulars[index])
+    hallow_plural = _hallow(plurals[index])
+    genre = genres[index]
+
+    text = _render_text(
         day=day,
         day_name=day_name,
-        hallow_prefix=hallow_prefix,
+        hallow_prefix=HALLOW_PREFIXES[genre],
         hallow=hallow,
-        hallow_all=hallow_all,
+    )
+    summary = _render_summary(
+        hallow_all=HALLOW_ALLS[genre],
         hallow_plural=hallow_plural,
     )
+    return text, summary
 
 
 def ensure_png_exists() -> None:
-    if not Path(LOLA_PNG_PATH).exists():
-        png_bytes = base64.b64decode(LOLA_PNG_DATA)
-        with open(LOLA_PNG_PATH, "wb") as image_file:
-            image_file.write(png_bytes)
+    """Write the icon unless a previous run already did.
 
+    A file with unexpected size, eg truncated, is overwritten.
+    """
+    try:
+        if os.stat(LOLA_PNG_PATH).st_size == len(LOLA_PNG_BYTES):
+            return
+    except FileNotFoundError:
+        pass
+    with open(LOLA_PNG_PATH, "wb") as image_file:
+        image_file.write(LOLA_PNG_BYTES)
 
-def send_notification(announce: str) -> bool:
-    """Send desktop notification for the given announce.
 
-    The notification is sent using the command ``notify-send``.
+@functools.cache
+def _session_bus():
+    from jeepney.io.blocking import open_dbus_connection
+
+    return open_dbus_connection(bus="SESSION")
 
-    Return True iff the subprocess call succeeded.
+
+def send_dbus_notification(summary: str, text: str) -> bool:
+    """Send desktop notification through a D-Bus call.
+
+    The ``Notify`` method of the notification server is called
+    directly, using the ``jeepney`` library when it's available.
+
+    Return True iff the method call succeeded.
     """
-    ensure_png_exists()
+    try:
+        from jeepney import DBusAddress, DBusErrorResponse, new_method_call
+        from jeepney.wrappers import unwrap_msg
+    except ImportError:
+        LOGGER.debug("Is jeepney available?")
+        return False
 
-    text, summary = announce.splitlines()
-    command = [
-        "notify-send",
-        "--app-name=Annonce de Lola",
-        "--urgency=normal",
-        f"--icon={LOLA_PNG_PATH}",
-        summary,
-        text
-    ]
+    address = DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications",
+    )
+    message = new_method_call(
+        address,
+        "Notify",
+        "susssasa{sv}i",
+        (
+            "Annonce de Lola",
+            0,
+            LOLA_PNG_PATH,
+            summary,
+            text,
+            [],
+            {"urgency": ("y", 1)},
+            -1,
+        ),
+    )
+    try:
+        unwrap_msg(_session_bus().send_and_get_reply(message))
+    except (KeyError, OSError, ValueError):
+        LOGGER.debug("Is a session bus available?")
+        return False
+    except DBusErrorResponse as ex:
+        LOGGER.debug(f"Notify call failed with {ex.name}: {ex.data}")
+        return False
+    return True
+
+
+def has_session_bus() -> bool:
+    """Check whether a D-Bus session bus is advertised.
+
+    Only the environment and the default socket path are checked,
+    without connecting.
+    """
+    if os.environ.get("DBUS_SESSION_BUS_ADDRESS"):
+        return True
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return bool(runtime_dir) and os.path.exists(os.path.join(runtime_dir, "bus"))
+
+
+def send_libnotify_notification(summary: str, text: str) -> bool:
+    """Send desktop notification through libnotify.
+
+    The library is loaded with ctypes, when it's installed.
+
+    Return True iff the notification was shown.
+    """
+    import ctypes
+
+    try:
+        libnotify = ctypes.CDLL("libnotify.so.4")
+    except OSError:
+        LOGGER.debug("Is libnotify available?")
+        return False
+
+    libnotify.notify_init.argtypes = [ctypes.c_char_p]
+    libnotify.notify_init.restype = ctypes.c_int
+    libnotify.notify_notification_new.argtypes = [ctypes.c_char_p] * 3
+    libnotify.notify_notification_new.restype = ctypes.c_void_p
+    libnotify.notify_notification_set_urgency.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    libnotify.notify_notification_set_urgency.restype = None
+    libnotify.notify_notification_show.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    libnotify.notify_notification_show.restype = ctypes.c_int
+    libnotify.g_object_unref.argtypes = [ctypes.c_void_p]
+    libnotify.g_object_unref.restype = None
+
+    if not libnotify.notify_init(b"Annonce de Lola"):
+        LOGGER.debug("Failed to initialize libnotify")
+        return False
+
+    try:
+        notification = libnotify.notify_notification_new(
+            summary.encode(), text.encode(), LOLA_PNG_PATH.encode()
+        )
+        libnotify.notify_notification_set_urgency(notification, 1)  # Normal
+        shown = libnotify.notify_notification_show(notification, None)
+        libnotify.g_object_unref(notification)
+    finally:
+        libnotify.notify_uninit()
+
+    if not shown:
+        LOGGER.debug("Failed to show notification with libnotify")
+        return False
+    return True
+
+
+# Command to send a notification, up to the summary and text arguments
+_NOTIFY_PREFIX = (
+    "notify-send",
+    "--app-name=Annonce de Lola",
+    "--urgency=normal",
+    f"--icon={LOLA_PNG_PATH}",
+)
+
+
+def _run_command(command: tuple[str, ...]) -> bool:
+    import subprocess
+
+    # Output is only worth capturing to be logged
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        output = subprocess.PIPE
+    else:
+        output = subprocess.DEVNULL
     try:
-        result = subprocess.run(
+        subprocess.run(
             command,
-            capture_output=True,
+            stdout=output,
+            stderr=output,
             check=True,
             text=True,
             encoding="utf-8",
             errors="replace"
         )
     except (OSError, FileNotFoundError):
-        LOGGER.debug("Is notify-send available?")
+        LOGGER.debug(f"Is {command[0]} available?")
         return False
     except subprocess.CalledProcessError as ex:
         LOGGER.debug(f"Subprocess exited with {ex.returncode} status")
@@ -703,15 +1146,111 @@ def send_notification(announce: str) -> bool:
     return True
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--stdout", help="use standard output", action="store_true")
-    args = parser.parse_args()
+def send_command_notification(summary: str, text: str) -> bool:
+    """Send desktop notification using the command ``notify-send``.
+
+    The command is spawned with ``posix_spawn()`` where available, its
+    output being discarded. The subprocess module is used otherwise,
+    or when debug messages are logged since the command output is then
+    captured to be logged.
+
+    Return True iff the command succeeded.
+    """
+    command = (*_NOTIFY_PREFIX, summary, text)
+    if not hasattr(os, "posix_spawnp") or LOGGER.isEnabledFor(logging.DEBUG):
+        return _run_command(command)
+
+    try:
+        pid = os.posix_spawnp(
+            command[0],
+            command,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ],
+        )
+    except OSError:
+        return False
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status) == 0
+
+
+def send_notification(announce: tuple[str, str]) -> bool:
+    """Send desktop notification for the given announce.
+
+    The notification is sent through a direct D-Bus call, falling back
+    to libnotify and then to the command ``notify-send``.
+
+    Return True iff the notification was sent.
+    """
+    ensure_png_exists()
+
+    text, summary = announce
+    return (
+        send_dbus_notification(summary, text)
+        or send_libnotify_notification(summary, text)
+        or send_command_notification(summary, text)
+    )
+
+
+# Command line options and their help, parsed without argparse since
+# importing it costs more than parsing two flags
+OPTIONS = {
+    "--stdout": "use standard output",
+    "--verbose": "log debug messages",
+}
+
+
+def parse_options(argv: list[str]) -> set[str]:
+    """Return the options given on the command line.
+
+    Print help and exit on ``-h`` or ``--help``, or print usage and
+    exit with status 2 on unknown arguments.
+    """
+    prog = os.path.basename(argv[0])
+    usage = f"usage: {prog} [-h] " + " ".join(f"[{option}]" for option in OPTIONS)
+    args = argv[1:]
+    if "-h" in args or "--help" in args:
+        print(usage, "", "options:", sep="\n")
+        print("  -h, --help  show this help message and exit")
+        for option, description in OPTIONS.items():
+            print(f"  {option:<10}  {description}")
+        raise SystemExit(0)
+
+    unknown = [arg for arg in args if arg not in OPTIONS]
+    if unknown:
+        print(usage, file=sys.stderr)
+        print(
+            f"{prog}: error: unrecognized arguments: {' '.join(unknown)}",
+            file=sys.stderr,
+        )
+        raise SystemExit(2)
+
+    return set(args)
+
+
+def main() -> int:
+    options = parse_options(sys.argv)
+    verbose = "--verbose" in options
+    stdout = "--stdout" in options
+
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING)
 
     announce = get_announce()
 
-    if args.stdout is True:
-        print(announce)
-    else:
-        sent = send_notification(announce)
-        exit(0 if sent else 1)
+    if not stdout and not has_session_bus():
+        LOGGER.debug("No session bus found, using standard output")
+        stdout = True
+
+    if stdout:
+        print(*announce, sep="\n")
+        return 0
+
+    sent = send_notification(announce)
+    return 0 if sent else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
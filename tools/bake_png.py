@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""Embed lola.png into the script as a bytes literal.
+
+The ``LOLA_PNG_BYTES`` assignment of ``lola_daily_announcement.py`` is
+replaced by the content of ``lola.png``, so that the script writes the
+icon without any decoding step.
+
+"""
+
+from pathlib import Path
+import re
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+PNG_PATH = ROOT_PATH / "lola.png"
+SCRIPT_PATH = ROOT_PATH / "lola_daily_announcement.py"
+
+LINE_LENGTH = 88
+INDENT = "    "
+
+LITERAL_PATTERN = re.compile(
+    r"^# Content of lola\.png.*?\nLOLA_PNG_BYTES = \(\n.*?^\)\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def escape(byte: int) -> str:
+    char = chr(byte)
+    if char.isascii() and char.isprintable() and char not in '\\"':
+        return char
+    return f"\\x{byte:02x}"
+
+
+def format_literal(data: bytes) -> str:
+    """Return the assignment of data to ``LOLA_PNG_BYTES``.
+
+    The bytes literal is split into lines fitting ``LINE_LENGTH``.
+    """
+    max_length = LINE_LENGTH - len(f'{INDENT}b""')
+    lines = []
+    line = ""
+    for byte in data:
+        token = escape(byte)
+        if len(line) + len(token) > max_length:
+            lines.append(f'{INDENT}b"{line}"')
+            line = ""
+        line += token
+    if line:
+        lines.append(f'{INDENT}b"{line}"')
+
+    body = "\n".join(lines)
+    return (
+        "# Content of lola.png, generated by tools/bake_png.py\n"
+        f"LOLA_PNG_BYTES = (\n{body}\n)\n"
+    )
+
+
+def main() -> int:
+    script = SCRIPT_PATH.read_text(encoding="utf-8")
+    literal = format_literal(PNG_PATH.read_bytes())
+    baked, count = LITERAL_PATTERN.subn(lambda _: literal, script)
+    if count != 1:
+        print(f"Expected one LOLA_PNG_BYTES assignment in {SCRIPT_PATH.name}")
+        return 1
+
+    SCRIPT_PATH.write_text(baked, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())